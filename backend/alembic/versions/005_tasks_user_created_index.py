@@ -0,0 +1,55 @@
+"""Add (user_id, created_at DESC, id DESC) index for the task list query
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-01-15
+
+get_tasks filters on user_id and pages by (created_at, id) DESC. The
+composite index serves each page as an index range scan with no Sort node,
+and its user_id prefix makes the single-column ix_tasks_user_id redundant.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Replace ix_tasks_user_id with ix_tasks_user_created"""
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_user_created',
+            'tasks',
+            ['user_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.drop_index(
+            'ix_tasks_user_id',
+            table_name='tasks',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
+
+
+def downgrade():
+    """Restore ix_tasks_user_id and drop ix_tasks_user_created"""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_user_id',
+            'tasks',
+            ['user_id'],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.drop_index(
+            'ix_tasks_user_created',
+            table_name='tasks',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
@@ -0,0 +1,55 @@
+"""Add jsonb_path_ops GIN indexes for JSONB containment queries
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-01-15
+
+The JSONB columns are filtered with containment (``@>``), e.g. reminders
+whose notification_channels contain {"channels": ["email"]}. jsonb_path_ops
+GIN indexes support only containment but are several times smaller and
+faster to probe than the default jsonb_ops opclass.
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+# (index name, table, JSONB column)
+JSONB_PATH_INDEXES = [
+    ('ix_tasks_reminder_config_path', 'tasks', 'reminder_config'),
+    ('ix_events_payload_path', 'events', 'payload'),
+    ('ix_events_metadata_path', 'events', 'metadata'),
+    ('ix_reminders_notification_channels_path', 'reminders', 'notification_channels'),
+    ('ix_recurrence_patterns_task_template_path', 'recurrence_patterns', 'task_template'),
+]
+
+
+def upgrade():
+    """Create jsonb_path_ops GIN indexes"""
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for index_name, table_name, column in JSONB_PATH_INDEXES:
+            op.create_index(
+                index_name,
+                table_name,
+                [column],
+                postgresql_using='gin',
+                postgresql_ops={column: 'jsonb_path_ops'},
+                postgresql_concurrently=True,
+                if_not_exists=True
+            )
+
+
+def downgrade():
+    """Drop jsonb_path_ops GIN indexes"""
+    with op.get_context().autocommit_block():
+        for index_name, table_name, _ in JSONB_PATH_INDEXES:
+            op.drop_index(
+                index_name,
+                table_name=table_name,
+                postgresql_concurrently=True,
+                if_exists=True
+            )
@@ -0,0 +1,37 @@
+"""Add events_outbox table for transactional event publishing
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-01-16
+
+Task handlers insert CloudEvents into events_outbox in the same transaction
+as the task change; the outbox relay publishes rows in id order and deletes
+them once delivered.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create events_outbox table"""
+    op.create_table(
+        'events_outbox',
+        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),  # BIGSERIAL
+        sa.Column('topic', sa.Text(), nullable=False),
+        sa.Column('event_type', sa.String(length=100), nullable=False),
+        sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade():
+    """Drop events_outbox table"""
+    op.drop_table('events_outbox')
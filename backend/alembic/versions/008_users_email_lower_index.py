@@ -0,0 +1,42 @@
+"""Add unique index on lower(email) for case-insensitive login lookups
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-01-16
+
+login matches users on lower(email); this expression index serves that
+lookup and also rejects emails that differ only by case.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create ux_users_email_lower"""
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ux_users_email_lower',
+            'users',
+            [sa.text('lower(email)')],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade():
+    """Drop ux_users_email_lower"""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ux_users_email_lower',
+            table_name='users',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
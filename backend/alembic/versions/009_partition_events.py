@@ -0,0 +1,145 @@
+"""Range-partition the events table by month on created_at
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-01-20
+
+events is append-only and queried by time range, so it is rebuilt as a
+table partitioned by RANGE (created_at) with a primary key of
+(id, created_at) (unique constraints on a partitioned table must include
+the partition key). Existing rows are copied into monthly partitions that
+cover their range, which leaves events_default empty so
+app.db.partitions.ensure_event_partitions() can keep adding months at
+startup. Old months can then be detached or dropped for retention.
+
+The created_at B-tree is replaced by a BRIN index: rows arrive in
+created_at order, so BRIN stays tiny as history grows.
+
+The rebuild holds an ACCESS EXCLUSIVE lock on events while rows are copied.
+"""
+from datetime import date
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+EVENT_COLUMNS = (
+    "id, event_type, aggregate_type, aggregate_id, user_id, payload, metadata, created_at"
+)
+
+# (index name, JSONB column) - jsonb_path_ops GIN indexes from revision 006
+JSONB_PATH_INDEXES = [
+    ('ix_events_payload_path', 'payload'),
+    ('ix_events_metadata_path', 'metadata'),
+]
+
+
+def _add_months(month, count):
+    """Return the first day of the month ``count`` months after ``month``."""
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _event_columns(id_server_default=None):
+    """Column definitions shared by the partitioned and plain events tables."""
+    return [
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False, server_default=id_server_default),
+        sa.Column('event_type', sa.String(length=50), nullable=False),
+        sa.Column('aggregate_type', sa.String(length=50), nullable=False),
+        sa.Column('aggregate_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('metadata', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column('created_at', sa.TIMESTAMP(), nullable=False, server_default=sa.text('NOW()')),
+        sa.CheckConstraint('length(event_type) > 0', name='ck_events_event_type_not_empty'),
+        sa.CheckConstraint('length(aggregate_type) > 0', name='ck_events_aggregate_type_not_empty'),
+    ]
+
+
+def _create_jsonb_path_indexes():
+    """Create the events jsonb_path_ops GIN indexes on the current events table."""
+    for index_name, column in JSONB_PATH_INDEXES:
+        op.create_index(
+            index_name,
+            'events',
+            [column],
+            postgresql_using='gin',
+            postgresql_ops={column: 'jsonb_path_ops'}
+        )
+
+
+def upgrade():
+    """Rebuild events as a monthly range-partitioned table"""
+    # Free the events / events_pkey names for the new table
+    op.execute("ALTER TABLE events RENAME TO events_unpartitioned")
+    op.execute("ALTER TABLE events_unpartitioned RENAME CONSTRAINT events_pkey TO events_unpartitioned_pkey")
+
+    # id is a UUIDv7 generated by the application (no server default)
+    op.create_table(
+        'events',
+        *_event_columns(),
+        sa.PrimaryKeyConstraint('id', 'created_at'),
+        postgresql_partition_by='RANGE (created_at)'
+    )
+
+    # One partition per month from the oldest row through the current month,
+    # so no existing row lands in events_default
+    first, last = op.get_bind().execute(
+        sa.text("SELECT min(created_at), max(created_at) FROM events_unpartitioned")
+    ).one()
+    this_month = date.today().replace(day=1)
+    month = first.date().replace(day=1) if first else this_month
+    last_month = max(last.date().replace(day=1), this_month) if last else this_month
+    while month <= last_month:
+        end = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE events_y{month.year}m{month.month:02d} PARTITION OF events "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{end.isoformat()}')"
+        )
+        month = end
+    op.execute("CREATE TABLE events_default PARTITION OF events DEFAULT")
+
+    op.execute(f"INSERT INTO events ({EVENT_COLUMNS}) SELECT {EVENT_COLUMNS} FROM events_unpartitioned")
+    op.drop_table('events_unpartitioned')
+
+    # Indexes on the parent cascade to every partition. CONCURRENTLY is not
+    # supported on partitioned tables; the table is locked for the rebuild anyway.
+    # "Recent events for aggregate X": trailing created_at DESC avoids a sort
+    op.create_index(
+        'idx_events_aggregate_time',
+        'events',
+        ['aggregate_type', 'aggregate_id', sa.text('created_at DESC')]
+    )
+    op.create_index(
+        'events_created_brin',
+        'events',
+        ['created_at'],
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32}
+    )
+    _create_jsonb_path_indexes()
+
+
+def downgrade():
+    """Rebuild events as a plain table with its pre-009 indexes"""
+    op.execute("ALTER TABLE events RENAME TO events_partitioned")
+    op.execute("ALTER TABLE events_partitioned RENAME CONSTRAINT events_pkey TO events_partitioned_pkey")
+
+    op.create_table(
+        'events',
+        *_event_columns(id_server_default=sa.text('gen_random_uuid()')),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.execute(f"INSERT INTO events ({EVENT_COLUMNS}) SELECT {EVENT_COLUMNS} FROM events_partitioned")
+    # Drops every partition with the parent
+    op.drop_table('events_partitioned')
+
+    op.create_index('idx_events_aggregate', 'events', ['aggregate_type', 'aggregate_id'])
+    op.create_index('idx_events_created_at', 'events', ['created_at'])
+    _create_jsonb_path_indexes()
@@ -0,0 +1,92 @@
+"""Replace Phase V worker indexes with partial indexes on pending rows
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-01-20
+
+The reminder and notification workers only poll rows with
+status = 'pending'. Partial indexes over just those rows stay small as
+fired/sent history accumulates and turn each poll into a short range scan:
+
+- reminders: idx_reminders_scheduled_time -> idx_reminders_pending_due
+- notifications: idx_notifications_status_created -> idx_notifications_pending_created
+  (serves app.db.notifications.claim_pending_notifications)
+
+Indexes are built and dropped CONCURRENTLY so the workers keep running
+during the migration.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+PENDING = sa.text("status = 'pending'")
+
+
+def upgrade():
+    """Create the pending-row partial indexes, then drop the full ones"""
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_reminders_pending_due',
+            'reminders',
+            ['scheduled_time'],
+            postgresql_where=PENDING,
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.create_index(
+            'idx_notifications_pending_created',
+            'notifications',
+            ['created_at'],
+            postgresql_where=PENDING,
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.drop_index(
+            'idx_reminders_scheduled_time',
+            table_name='reminders',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
+        op.drop_index(
+            'idx_notifications_status_created',
+            table_name='notifications',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
+
+
+def downgrade():
+    """Restore the full worker indexes and drop the partial ones"""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_reminders_scheduled_time',
+            'reminders',
+            ['scheduled_time'],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.create_index(
+            'idx_notifications_status_created',
+            'notifications',
+            ['status', 'created_at'],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.drop_index(
+            'idx_reminders_pending_due',
+            table_name='reminders',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
+        op.drop_index(
+            'idx_notifications_pending_created',
+            table_name='notifications',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
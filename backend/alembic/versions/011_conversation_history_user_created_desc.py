@@ -0,0 +1,71 @@
+"""Index conversation_history on (user_id, created_at DESC) only
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-01-20
+
+The chat history query reads the last N messages for a user
+(WHERE user_id = ? ORDER BY created_at DESC LIMIT N). A composite index with
+created_at DESC serves it with a forward index scan, and its user_id prefix
+covers plain user_id lookups, so the single-column indexes from 003 and the
+ascending composite are dropped.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+# Indexes created by revision 003
+OLD_INDEXES = [
+    ('ix_conversation_history_user_id', ['user_id']),
+    ('ix_conversation_history_created_at', ['created_at']),
+    ('ix_conversation_history_user_id_created_at', ['user_id', 'created_at']),
+]
+# Same name as the 003 composite, so it is built under a temporary name
+NEW_INDEX = 'ix_conversation_history_user_id_created_at'
+TMP_INDEX = 'ix_conversation_history_user_id_created_at_desc'
+
+
+def upgrade():
+    """Replace the 003 indexes with (user_id, created_at DESC)"""
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            TMP_INDEX,
+            'conversation_history',
+            ['user_id', sa.text('created_at DESC')],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        for index_name, _ in OLD_INDEXES:
+            op.drop_index(
+                index_name,
+                table_name='conversation_history',
+                postgresql_concurrently=True,
+                if_exists=True
+            )
+        op.execute(f"ALTER INDEX {TMP_INDEX} RENAME TO {NEW_INDEX}")
+
+
+def downgrade():
+    """Restore the 003 indexes"""
+    with op.get_context().autocommit_block():
+        op.execute(f"ALTER INDEX {NEW_INDEX} RENAME TO {TMP_INDEX}")
+        for index_name, columns in OLD_INDEXES:
+            op.create_index(
+                index_name,
+                'conversation_history',
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True
+            )
+        op.drop_index(
+            TMP_INDEX,
+            table_name='conversation_history',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
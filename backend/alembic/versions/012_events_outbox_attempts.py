@@ -0,0 +1,31 @@
+"""Add events_outbox.attempts for retry limits and dead-lettering
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-01-21
+
+The outbox relay skips a row that fails to publish and counts the failure
+in attempts. Rows that reach OUTBOX_MAX_ATTEMPTS (app.events.outbox) are
+dead-lettered: kept for inspection but no longer claimed.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add the attempts counter (existing rows start at 0)"""
+    op.add_column(
+        'events_outbox',
+        sa.Column('attempts', sa.Integer(), server_default=sa.text('0'), nullable=False)
+    )
+
+
+def downgrade():
+    """Drop the attempts counter"""
+    op.drop_column('events_outbox', 'attempts')
@@ -1,46 +1,112 @@
 """Authentication utilities for password hashing and JWT."""
 
+import json
 import os
-from datetime import datetime, timedelta
-from passlib.context import CryptContext
-from jose import JWTError, jwt
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import bcrypt
+import jwt
+from cachetools import TTLCache
+from jwt import PyJWS, InvalidTokenError, ExpiredSignatureError
 from dotenv import load_dotenv
 
 load_dotenv()
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing (bcrypt C extension, no passlib wrapper layer)
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "10"))
+# Dedicated pool for hashing: one thread per core, kept apart from FastAPI's
+# shared threadpool. bcrypt releases the GIL, so threads hash in parallel.
+HASH_POOL = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="bcrypt")
 
 # JWT configuration
 SECRET_KEY = os.getenv("JWT_SECRET_KEY", "fallback-secret-key-for-development-only")
+_SECRET_KEY_BYTES = SECRET_KEY.encode("utf-8")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_HOURS = int(os.getenv("ACCESS_TOKEN_EXPIRE_HOURS", "24"))
+_ACCESS_TOKEN_EXPIRE_SECONDS = ACCESS_TOKEN_EXPIRE_HOURS * 3600
+
+# Reusable signer: encodes pre-serialized claims, skipping PyJWT's
+# per-call claim normalization (datetime conversion, JSON encoder setup)
+_jws = PyJWS()
+
+# Decoded token cache (skips HMAC + base64 + JSON parse on repeat requests)
+# Only successfully decoded payloads are stored; expiry is re-checked on hit.
+_decoded_tokens: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+# Tokens revoked by logout, kept until they would have expired anyway
+_revoked_tokens: TTLCache = TTLCache(maxsize=100_000, ttl=_ACCESS_TOKEN_EXPIRE_SECONDS)
+_token_cache_lock = threading.Lock()
 
 
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt."""
-    return pwd_context.hash(password)
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    try:
+        return bcrypt.checkpw(
+            plain_password.encode("utf-8"),
+            hashed_password.encode("utf-8")
+        )
+    except ValueError:
+        # Malformed or non-bcrypt hash
+        return False
 
 
-def create_jwt(user_id: int) -> str:
-    """Create a JWT token for a user."""
-    expire = datetime.utcnow() + timedelta(hours=ACCESS_TOKEN_EXPIRE_HOURS)
+def create_jwt(user_id: int, email: str | None = None) -> str:
+    """Create a JWT token for a user.
+
+    The email claim lets request handlers identify the user without a DB lookup.
+    """
     payload = {
         "user_id": user_id,
-        "exp": expire
+        "exp": int(time.time()) + _ACCESS_TOKEN_EXPIRE_SECONDS
     }
-    return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
+    if email is not None:
+        payload["email"] = email
+    claims = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return _jws.encode(claims, _SECRET_KEY_BYTES, algorithm=ALGORITHM)
+
+
+def _decode_jwt_cached(token: str) -> dict:
+    """Decode a JWT token, serving repeat tokens from the TTL cache.
+
+    Raises InvalidTokenError for invalid tokens so failures are never cached.
+    """
+    with _token_cache_lock:
+        payload = _decoded_tokens.get(token)
+    if payload is not None:
+        if payload.get("exp", 0) <= time.time():
+            raise ExpiredSignatureError("Signature has expired")
+        return payload
+
+    payload = jwt.decode(
+        token,
+        _SECRET_KEY_BYTES,
+        algorithms=[ALGORITHM],
+        options={"require": ["exp"]}
+    )
+    with _token_cache_lock:
+        _decoded_tokens[token] = payload
+    return payload
 
 
 def decode_jwt(token: str) -> dict | None:
     """Decode and validate a JWT token."""
+    with _token_cache_lock:
+        if token in _revoked_tokens:
+            return None
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
-    except JWTError:
+        return _decode_jwt_cached(token)
+    except InvalidTokenError:
         return None
+
+
+def revoke_jwt(token: str) -> None:
+    """Revoke a JWT token (e.g. on logout) and drop it from the decode cache."""
+    with _token_cache_lock:
+        _revoked_tokens[token] = True
+        _decoded_tokens.pop(token, None)
@@ -1,6 +1,8 @@
 """Database connection and session management."""
 
 import os
+import orjson
+from sqlalchemy.engine import URL, make_url
 from sqlmodel import create_engine, Session, SQLModel
 from dotenv import load_dotenv
 
@@ -11,19 +13,41 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL environment variable is not set")
 
+
+def _connect_args(url: URL) -> dict:
+    """psycopg2 connection options for PostgreSQL URLs; none for other databases.
+
+    sslmode set in the DSN wins; otherwise DB_SSLMODE, defaulting to
+    "prefer" (Neon still negotiates SSL, local Postgres works without it).
+    """
+    if url.get_backend_name() != "postgresql":
+        return {}
+    connect_args = {"application_name": "todo-api"}
+    if "sslmode" not in url.query:
+        connect_args["sslmode"] = os.getenv("DB_SSLMODE", "prefer")
+    return connect_args
+
+
 # Create engine with connection pooling for Neon serverless
 engine = create_engine(
     DATABASE_URL,
-    echo=True,  # SQL logging for development
-    pool_size=5,
-    max_overflow=10,
+    echo=os.getenv("SQL_ECHO", "false").lower() == "true",  # SQL logging (dev only)
+    pool_size=int(os.getenv("DB_POOL_SIZE", "20")),
+    max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "40")),
+    pool_recycle=1800,  # Recycle connections before Neon drops idle ones
     pool_pre_ping=True,  # Verify connections before using
+    json_serializer=lambda obj: orjson.dumps(obj).decode(),  # JSONB columns (outbox payloads, configs)
+    connect_args=_connect_args(make_url(DATABASE_URL)),
 )
 
 
 def get_session():
-    """FastAPI dependency for database sessions."""
-    with Session(engine) as session:
+    """FastAPI dependency for database sessions.
+
+    expire_on_commit=False keeps committed instances (e.g. rows returned by
+    INSERT/UPDATE ... RETURNING) readable without a refresh SELECT.
+    """
+    with Session(engine, expire_on_commit=False) as session:
         yield session
 
 
@@ -0,0 +1 @@
+# Database helpers package
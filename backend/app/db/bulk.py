@@ -0,0 +1,96 @@
+"""Bulk insert helper for worker and background writes.
+
+Phase: Phase V - Event-Driven Architecture
+
+Workers that write to notifications, events, or reminders should go through
+bulk_insert() instead of inserting rows one by one. Rows are sent with
+psycopg2's execute_values, which packs up to ``page_size`` rows into each
+multi-row INSERT statement, and duplicates are skipped with
+ON CONFLICT DO NOTHING so retried batches are idempotent. Values are
+adapted by the type of their target column (JSON/JSONB vs ARRAY etc.).
+"""
+
+from enum import Enum
+from typing import Any, Sequence
+
+import orjson
+from psycopg2.extras import Json, execute_values, register_uuid
+from sqlalchemy import JSON, Table
+from sqlalchemy.engine import Engine
+from sqlalchemy.types import TypeEngine
+
+# Let psycopg2 adapt uuid.UUID values directly
+register_uuid()
+
+DEFAULT_PAGE_SIZE = 500
+
+
+def _dumps_json(value: Any) -> str:
+    """Serialize JSONB values with orjson (matches the engine's json_serializer)."""
+    return orjson.dumps(value).decode()
+
+
+def _adapt(column_type: TypeEngine, value: Any) -> Any:
+    """Adapt a value psycopg2 cannot send as-is for its target column.
+
+    Only JSON/JSONB columns get a Json wrapper; lists bound for ARRAY
+    columns are passed through for psycopg2's native array adaptation.
+    """
+    if value is None:
+        return None
+    if isinstance(column_type, JSON):  # Includes postgresql.JSON and JSONB
+        return Json(value, dumps=_dumps_json)
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def bulk_insert(
+    engine: Engine,
+    table: Table,
+    rows: Sequence[dict[str, Any]],
+    page_size: int = DEFAULT_PAGE_SIZE
+) -> None:
+    """Insert rows into a table with multi-row INSERT ... ON CONFLICT DO NOTHING.
+
+    Args:
+        engine: Engine bound to the PostgreSQL database
+        table: Target table (e.g. ``Notification.__table__``)
+        rows: Column/value mappings. Rows with different key sets are sent
+            as separate INSERT statements (omitted columns take their
+            server default), all in one transaction. Rows for reminders/
+            events/notifications should include ``id`` (a uuid7).
+        page_size: Rows per INSERT statement
+
+    Raises:
+        ValueError: If a row names a column the table does not have
+    """
+    if not rows:
+        return
+
+    unknown = {key for row in rows for key in row} - set(table.c.keys())
+    if unknown:
+        raise ValueError(f"{table.name} has no column(s): {', '.join(sorted(unknown))}")
+
+    # Group rows by key set so every row in a statement fills the same columns
+    groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+    for row in rows:
+        groups.setdefault(tuple(sorted(row)), []).append(row)
+
+    quote = engine.dialect.identifier_preparer.quote
+    with engine.begin() as connection:
+        cursor = connection.connection.cursor()
+        try:
+            for columns, group in groups.items():
+                statement = (
+                    f"INSERT INTO {quote(table.name)} ({', '.join(quote(c) for c in columns)}) "
+                    f"VALUES %s ON CONFLICT DO NOTHING"
+                )
+                types = [table.c[c].type for c in columns]
+                values = [
+                    tuple(_adapt(t, row[c]) for t, c in zip(types, columns))
+                    for row in group
+                ]
+                execute_values(cursor, statement, values, page_size=page_size)
+        finally:
+            cursor.close()
@@ -0,0 +1,36 @@
+"""Notification worker queries.
+
+Phase: Phase V - Event-Driven Architecture
+"""
+
+from uuid import UUID
+
+from sqlmodel import Session, select
+
+from app.models import Notification, NotificationStatusEnum
+
+CLAIM_BATCH_SIZE = 500
+
+
+def claim_pending_notifications(session: Session, limit: int = CLAIM_BATCH_SIZE) -> list[UUID]:
+    """Lock and return the ids of the oldest pending notifications.
+
+    Served entirely by the idx_notifications_pending_created partial index.
+    SKIP LOCKED lets several workers claim disjoint batches concurrently;
+    the row locks are held until the caller commits.
+
+    Args:
+        session: Open database session (its transaction holds the locks)
+        limit: Maximum number of notifications to claim
+
+    Returns:
+        Notification ids in creation order
+    """
+    statement = (
+        select(Notification.id)
+        .where(Notification.status == NotificationStatusEnum.pending)
+        .order_by(Notification.created_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    return list(session.exec(statement).all())
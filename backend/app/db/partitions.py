@@ -0,0 +1,73 @@
+"""Monthly partition maintenance for the events table.
+
+Phase: Phase V - Event-Driven Architecture
+
+events is range-partitioned on created_at (migration 009). Rows whose month
+has no partition fall into events_default, which is correct but defeats
+partition pruning and retention by DROP, so partitions for the current and
+upcoming months are created ahead of time at startup.
+"""
+
+import logging
+from datetime import date
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+EVENT_PARTITION_MONTHS_AHEAD = 2
+
+
+def _add_months(month: date, count: int) -> date:
+    """Return the first day of the month ``count`` months after ``month``."""
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def ensure_event_partitions(
+    engine: Engine,
+    months_ahead: int = EVENT_PARTITION_MONTHS_AHEAD
+) -> None:
+    """Create monthly events partitions from this month through ``months_ahead``.
+
+    Idempotent: existing partitions are left untouched. Partitions are
+    named events_yYYYYmMM and cover [first of month, first of next month).
+    Also creates events_default, which create_all (dev) does not. Does
+    nothing (with a warning) if events has not been partitioned yet.
+    """
+    with engine.connect() as connection:
+        partitioned = connection.execute(text(
+            "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass('events')"
+        )).first()
+    if partitioned is None:
+        logger.warning("events is not a partitioned table; run alembic upgrade (revision 009)")
+        return
+
+    this_month = date.today().replace(day=1)
+
+    statements = ["CREATE TABLE IF NOT EXISTS events_default PARTITION OF events DEFAULT"]
+    for offset in range(months_ahead + 1):
+        start = _add_months(this_month, offset)
+        end = _add_months(start, 1)
+        name = f"events_y{start.year}m{start.month:02d}"
+        statements.append(
+            f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF events "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+
+    # One transaction per partition so a single failure (e.g. matching rows
+    # already in events_default) does not block the others
+    failed = 0
+    for statement in statements:
+        try:
+            with engine.begin() as connection:
+                connection.execute(text(statement))
+        except Exception as e:
+            failed += 1
+            logger.error(f"Failed to create events partition ({statement}): {e}", exc_info=True)
+
+    logger.info(
+        f"Ensured events partitions through {_add_months(this_month, months_ahead)} "
+        f"({failed} failed)"
+    )
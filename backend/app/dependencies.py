@@ -1,19 +1,63 @@
-"""FastAPI dependencies for authentication and database."""
+"""FastAPI dependencies for authentication and database.
+
+Dependencies that touch the database are plain ``def`` functions: the
+Session is synchronous, so FastAPI runs them in its threadpool instead of
+blocking the event loop on the DB round-trip.
+"""
 
 import os
+import threading
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status, Cookie
-from sqlmodel import Session
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlmodel import Session, select
 from typing import Optional
-from app.database import get_session
-from app.auth import decode_jwt
+from app.database import engine, get_session
+from app.auth import decode_jwt, hash_password
 from app.models import User
 
+# Short-lived cache of detached User rows to skip a SELECT per request.
+# Entries are dropped on logout (invalidate_cached_user), so the TTL only
+# bounds staleness for changes made outside this process.
+USER_CACHE_TTL = int(os.getenv("USER_CACHE_TTL", "60"))
+_user_cache: TTLCache = TTLCache(maxsize=50_000, ttl=USER_CACHE_TTL)
+_user_cache_lock = threading.Lock()
 
-async def get_current_user(
-    access_token: Optional[str] = Cookie(None),
-    session: Session = Depends(get_session)
-) -> User:
-    """Get the current authenticated user from JWT cookie."""
+
+def _get_cached_user(session: Session, user_id: int) -> Optional[User]:
+    """Load a user by id, serving repeat lookups from the in-process cache.
+
+    The cache holds detached instances; each hit is merged into the
+    caller's session without emitting a SELECT.
+    """
+    with _user_cache_lock:
+        cached = _user_cache.get(user_id)
+
+    if cached is None:
+        user = session.get(User, user_id)
+        if not user:
+            return None
+        session.expunge(user)
+        with _user_cache_lock:
+            _user_cache[user_id] = user
+        cached = user
+
+    return session.merge(cached, load=False)
+
+
+def invalidate_cached_user(user_id: int) -> None:
+    """Drop a user from the cache (e.g. on logout or credential change)."""
+    with _user_cache_lock:
+        _user_cache.pop(user_id, None)
+
+
+async def get_current_user_id(
+    access_token: Optional[str] = Cookie(None)
+) -> int:
+    """Get the current user's id from the JWT cookie without touching the DB.
+
+    Use this for routes that only need to scope queries by user id.
+    """
     if not access_token:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -34,7 +78,15 @@ async def get_current_user(
             detail="Invalid token payload"
         )
 
-    user = session.get(User, user_id)
+    return user_id
+
+
+def get_current_user(
+    user_id: int = Depends(get_current_user_id),
+    session: Session = Depends(get_session)
+) -> User:
+    """Get the current authenticated user from JWT cookie."""
+    user = _get_cached_user(session, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -47,72 +99,62 @@ async def get_current_user(
 # ============================================================================
 # DEV-ONLY AUTHENTICATION BYPASS - DO NOT USE IN PRODUCTION
 # ============================================================================
-async def get_dev_or_current_user(
-    access_token: Optional[str] = Cookie(None),
-    session: Session = Depends(get_session)
-) -> User:
-    """
-    DEV-ONLY: Get dev user for local testing OR authenticated user in production.
-
-    ⚠️  WARNING: THIS IS FOR LOCAL DEVELOPMENT ONLY ⚠️
+IS_DEV = os.getenv("ENVIRONMENT", "production").lower() == "development"
+DEV_USER_ID = 1
+DEV_USER_EMAIL = "dev@local.test"
 
-    Behavior:
-    - ENVIRONMENT=development → Returns fixed dev user (id=1) for curl testing
-    - ENVIRONMENT=production → Full JWT authentication required
 
-    This allows testing /api/chat with curl without JWT tokens locally.
-    Production behavior is UNCHANGED - full authentication required.
+def ensure_dev_user() -> None:
+    """
+    DEV-ONLY: Make sure the fixed dev user exists. Called once at startup.
 
-    DO NOT USE THIS IN PRODUCTION ENDPOINTS.
+    Uses INSERT ... ON CONFLICT DO NOTHING so concurrent workers booting at
+    the same time cannot create duplicate dev users.
     """
-    environment = os.getenv("ENVIRONMENT", "production").lower()
-
-    # DEV MODE: Return fixed dev user for easy curl testing
-    if environment == "development":
-        # Try to get dev user (id=1)
-        dev_user = session.get(User, 1)
-
-        if not dev_user:
-            # Dev user doesn't exist - create it
-            from app.auth import hash_password
-            dev_user = User(
-                email="dev@local.test",
-                hashed_password=hash_password("dev123"),
-                name="DEV USER (Local Testing Only)"
-            )
-            session.add(dev_user)
-            session.commit()
-            session.refresh(dev_user)
-
-        return dev_user
-
-    # PRODUCTION MODE: Full authentication required (same as get_current_user)
-    if not access_token:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Not authenticated"
-        )
+    global DEV_USER_ID
 
-    payload = decode_jwt(access_token)
-    if not payload:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token"
-        )
+    with Session(engine) as session:
+        if session.get(User, DEV_USER_ID):
+            return
 
-    user_id = payload.get("user_id")
-    if not user_id:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token payload"
+        session.execute(
+            pg_insert(User)
+            .values(email=DEV_USER_EMAIL, hashed_password=hash_password("dev123"))
+            .on_conflict_do_nothing(index_elements=["email"])
         )
+        session.commit()
+        DEV_USER_ID = session.exec(
+            select(User.id).where(User.email == DEV_USER_EMAIL)
+        ).one()
 
-    user = session.get(User, user_id)
-    if not user:
+
+def _dev_user_dep(session: Session = Depends(get_session)) -> User:
+    """
+    DEV-ONLY: Return the fixed dev user without reading any cookie.
+
+    Dev user is bootstrapped at startup by ensure_dev_user().
+    """
+    dev_user = _get_cached_user(session, DEV_USER_ID)
+    if not dev_user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found"
+            detail="Dev user not found"
         )
 
-    return user
+    return dev_user
+
+
+# DEV-ONLY: Get dev user for local testing OR authenticated user in production.
+#
+# ⚠️  WARNING: THIS IS FOR LOCAL DEVELOPMENT ONLY ⚠️
+#
+# Resolved once at import time:
+# - ENVIRONMENT=development → fixed dev user (see ensure_dev_user) for curl testing
+# - ENVIRONMENT=production → get_current_user (full JWT authentication required)
+#
+# This allows testing /api/chat with curl without JWT tokens locally.
+# Production behavior is UNCHANGED - full authentication required.
+#
+# DO NOT USE THIS IN PRODUCTION ENDPOINTS.
+get_dev_or_current_user = _dev_user_dep if IS_DEV else get_current_user
 # ============================================================================
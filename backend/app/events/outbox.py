@@ -0,0 +1,185 @@
+"""Transactional outbox for CloudEvents emitted by request handlers.
+
+Phase: Phase V - Event-Driven Architecture
+
+Handlers call outbox_task_event() / outbox_reminder_event() before their
+commit, which adds an events_outbox row to the same transaction as the
+task change: either both are persisted or neither is. A relay task started
+at application startup claims a small batch with FOR UPDATE SKIP LOCKED (so
+several workers can run it), publishes it in id order, and deletes what was
+published in the same transaction. Row locks are held only while the batch
+is published: each publish has a timeout and the batch a deadline, after
+which the remaining rows are released for the next poll.
+
+A row that fails to publish is skipped and its attempts counter bumped, so
+it cannot block the rows behind it. After OUTBOX_MAX_ATTEMPTS failures it
+is dead-lettered: it stays in the table for inspection but is no longer
+claimed (reset attempts to 0 to requeue it). Rows that cannot be rebuilt
+into an event (unknown event_type, payload failing validation) will never
+succeed and are dead-lettered on the first try.
+
+Delivery is at-least-once: a row is deleted only after it was published,
+so a crash or failed commit can republish it. Order is not guaranteed
+across workers, which claim disjoint batches and publish concurrently.
+"""
+
+import asyncio
+import logging
+from typing import Any
+
+from pydantic import ValidationError
+from sqlalchemy import delete
+from sqlmodel import Session, select
+
+from app.database import engine
+from app.events import schemas as event_schemas
+from app.events.publisher import EventPublisher, get_event_publisher
+from app.models import EventOutbox
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_BATCH_SIZE = 50
+OUTBOX_POLL_INTERVAL = 0.5  # seconds to wait when the outbox is drained
+OUTBOX_PUBLISH_TIMEOUT = 5.0  # seconds before a single publish counts as failed
+OUTBOX_BATCH_DEADLINE = 10.0  # seconds a claimed batch may hold its row locks
+OUTBOX_MAX_ATTEMPTS = 10  # failed publishes before a row is dead-lettered
+
+TASK_EVENTS_TOPIC = "task-events"
+REMINDERS_TOPIC = "reminders"
+
+_relay: asyncio.Task | None = None
+
+
+def _add_outbox_event(session: Session, topic: str, event: Any) -> None:
+    """Stage an event in the caller's transaction."""
+    session.add(EventOutbox(
+        topic=topic,
+        event_type=type(event).__name__,
+        payload=event.model_dump(mode="json")
+    ))
+
+
+def outbox_task_event(session: Session, event: Any) -> None:
+    """Stage a task.* event for the task-events topic."""
+    _add_outbox_event(session, TASK_EVENTS_TOPIC, event)
+
+
+def outbox_reminder_event(session: Session, event: Any) -> None:
+    """Stage a reminder.* event for the reminders topic."""
+    _add_outbox_event(session, REMINDERS_TOPIC, event)
+
+
+def _claim_batch(session: Session) -> list[EventOutbox]:
+    """Lock the oldest unclaimed live outbox rows (held until commit/rollback)."""
+    statement = (
+        select(EventOutbox)
+        .where(EventOutbox.attempts < OUTBOX_MAX_ATTEMPTS)
+        .order_by(EventOutbox.id)
+        .limit(OUTBOX_BATCH_SIZE)
+        .with_for_update(skip_locked=True)
+    )
+    return list(session.exec(statement).all())
+
+
+def _finish_batch(session: Session, ids: list[int]) -> None:
+    """Delete published rows, save attempt counts and release the locks."""
+    if ids:
+        session.execute(delete(EventOutbox).where(EventOutbox.id.in_(ids)))
+    session.commit()
+
+
+def _rebuild_event(row: EventOutbox) -> Any:
+    """Rebuild the CloudEvent from its stored payload.
+
+    Raises AttributeError for an unknown event_type and ValidationError for
+    a payload that no longer matches its schema.
+    """
+    return getattr(event_schemas, row.event_type).model_validate(row.payload)
+
+
+async def _publish(publisher: EventPublisher, row: EventOutbox, event: Any) -> None:
+    """Publish a rebuilt CloudEvent to the row's topic."""
+    if row.topic == REMINDERS_TOPIC:
+        await publisher.publish_reminder_event(event)
+    else:
+        await publisher.publish_task_event(event)
+
+
+async def _relay_batch(publisher: EventPublisher) -> int:
+    """Publish one claimed batch; return the number of rows claimed."""
+    session = Session(engine)
+    try:
+        rows = await asyncio.to_thread(_claim_batch, session)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + OUTBOX_BATCH_DEADLINE
+        published_ids = []
+        for index, row in enumerate(rows):
+            if loop.time() >= deadline:
+                # Release the rest of the batch instead of holding its locks
+                logger.warning(f"Outbox batch deadline hit; {len(rows) - index} rows left")
+                break
+            try:
+                event = _rebuild_event(row)
+            except (AttributeError, ValidationError) as e:
+                # Permanent: retrying cannot rebuild this row
+                row.attempts = OUTBOX_MAX_ATTEMPTS
+                logger.error(
+                    f"Dead-lettered outbox event {row.id} ({row.event_type}): {e}",
+                    exc_info=True
+                )
+                continue
+            try:
+                await asyncio.wait_for(_publish(publisher, row, event), OUTBOX_PUBLISH_TIMEOUT)
+            except Exception as e:
+                # Skip this row; it is retried on a later poll until dead-lettered
+                row.attempts += 1
+                logger.error(
+                    f"Failed to publish outbox event {row.id} ({row.event_type}), "
+                    f"attempt {row.attempts}/{OUTBOX_MAX_ATTEMPTS}: {e}",
+                    exc_info=True
+                )
+                continue
+            published_ids.append(row.id)
+
+        if rows:
+            await asyncio.to_thread(_finish_batch, session, published_ids)
+        return len(rows)
+    finally:
+        await asyncio.to_thread(session.close)
+
+
+async def _relay_loop(publisher: EventPublisher) -> None:
+    """Drain the outbox, sleeping only when a batch comes back short."""
+    while True:
+        try:
+            claimed = await _relay_batch(publisher)
+        except Exception as e:
+            logger.error(f"Outbox relay failed: {e}", exc_info=True)
+            claimed = 0
+
+        if claimed < OUTBOX_BATCH_SIZE:
+            await asyncio.sleep(OUTBOX_POLL_INTERVAL)
+
+
+def start_outbox_relay() -> None:
+    """Start the background relay. Called from the startup hook.
+
+    The relay holds one publisher (and its pooled, keep-alive HTTP client)
+    for its whole lifetime, so publishes reuse warm connections.
+    """
+    global _relay
+    if _relay is None:
+        _relay = asyncio.create_task(_relay_loop(get_event_publisher()))
+
+
+async def stop_outbox_relay() -> None:
+    """Stop the relay. Unpublished rows stay in the outbox for the next start."""
+    global _relay
+    if _relay is not None:
+        _relay.cancel()
+        try:
+            await _relay
+        except asyncio.CancelledError:
+            pass
+        _relay = None
@@ -5,13 +5,20 @@ Phase: Phase V - Event-Driven Architecture
 """
 
 import os
+import asyncio
 import logging
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
-from app.database import create_db_and_tables
+from app.auth import HASH_POOL
+from app.database import create_db_and_tables, engine
+from app.db.partitions import ensure_event_partitions
+from app.dependencies import IS_DEV, ensure_dev_user
 from app.routers import auth, tasks, chat, recurring, reminders
+from app.schemas import ChatMetadata, ChatRequest, ChatResponse
 from app.events.publisher import close_event_publisher
+from app.events.outbox import start_outbox_relay, stop_outbox_relay
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -22,7 +29,8 @@ load_dotenv()
 app = FastAPI(
     title="Todo API",
     description="Phase-II Full-Stack Todo Application API",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse  # orjson: faster encoding of task lists
 )
 
 # CORS configuration for local development
@@ -47,6 +55,7 @@ app.add_middleware(
     ],
     expose_headers=[
         "Set-Cookie",
+        "X-Next-Cursor",  # get_tasks pagination
         "Access-Control-Allow-Credentials",
     ],
     max_age=600,  # Cache preflight requests for 10 minutes
@@ -66,8 +75,25 @@ async def add_security_headers(request, call_next):
 @app.on_event("startup")
 async def on_startup():
     """Initialize server on startup."""
-    # Create database tables
-    create_db_and_tables()
+    if IS_DEV:
+        # DEV-ONLY: Create tables from metadata; Alembic owns the schema
+        # everywhere else, so production boots skip the per-table checks
+        create_db_and_tables()
+
+        # DEV-ONLY: Bootstrap the dev user once instead of on every request
+        ensure_dev_user()
+
+    # Build the deferred chat schema validators once, before the first request
+    ChatMetadata.model_rebuild()
+    ChatRequest.model_rebuild()
+    ChatResponse.model_rebuild()
+
+    # Pre-create upcoming monthly partitions of the events table
+    try:
+        await asyncio.to_thread(ensure_event_partitions, engine)
+    except Exception as e:
+        # Rows still land in events_default; don't block startup
+        logger.error(f"Failed to ensure events partitions: {e}", exc_info=True)
 
     # Initialize MCP tools cache to avoid asyncio.run() in request handlers
     try:
@@ -82,6 +108,9 @@ async def on_startup():
     publisher = get_event_publisher()
     logger.info(f"Event publisher initialized: enabled={publisher.enabled}")
 
+    # Publish CloudEvents committed to the events_outbox table
+    start_outbox_relay()
+
 
 @app.on_event("shutdown")
 async def on_shutdown():
@@ -89,11 +118,17 @@ async def on_shutdown():
 
     Task: T-563 - Extend main.py for event publisher lifecycle
     """
+    # Stop the outbox relay before its publisher client is closed
+    await stop_outbox_relay()
+
     # Close event publisher HTTP client
     logger.info("Shutting down event publisher...")
     await close_event_publisher()
     logger.info("Event publisher closed")
 
+    # Stop password hashing threads
+    HASH_POOL.shutdown(wait=False)
+
 
 # Mount routers
 app.include_router(auth.router, prefix="/api")
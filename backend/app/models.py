@@ -9,12 +9,13 @@ Added Reminder model for reminders table.
 
 from enum import Enum as PyEnum
 from sqlmodel import Field, SQLModel, Relationship
-from sqlalchemy import Text, Column, text, Enum as SAEnum
+from sqlalchemy import Text, Column, Index, text, Enum as SAEnum
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PostgreSQL_UUID, ARRAY
-from sqlalchemy import Integer
-from datetime import datetime
+from sqlalchemy import BigInteger, DateTime, Integer
+from datetime import datetime, timezone
 from typing import Optional, Dict, Any, List
 from uuid import UUID, uuid4
+from uuid6 import uuid7
 
 
 # ============================================================================
@@ -62,15 +63,25 @@ class User(SQLModel, table=True):
     """User model for authentication."""
 
     __tablename__ = "users"
+    __table_args__ = (
+        # Case-insensitive email lookups (login) and uniqueness
+        Index("ux_users_email_lower", text("lower(email)"), unique=True),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     email: str = Field(unique=True, index=True, max_length=255)
     hashed_password: str = Field(max_length=255)
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
-    # Relationships
-    tasks: list["Task"] = Relationship(back_populates="user")
-    conversation_history: list["ConversationHistory"] = Relationship(back_populates="user")
+    # Relationships (lazy="raise": load explicitly, never via implicit N+1 SELECTs)
+    tasks: list["Task"] = Relationship(
+        back_populates="user",
+        sa_relationship_kwargs={"lazy": "raise"}
+    )
+    conversation_history: list["ConversationHistory"] = Relationship(
+        back_populates="user",
+        sa_relationship_kwargs={"lazy": "raise"}
+    )
 
 
 class Task(SQLModel, table=True):
@@ -80,9 +91,20 @@ class Task(SQLModel, table=True):
     """
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Serves get_tasks (user_id filter, (created_at, id) DESC keyset) without a sort
+        Index("ix_tasks_user_created", "user_id", text("created_at DESC"), text("id DESC")),
+        # jsonb_path_ops GIN: containment (@>) lookups only, much smaller than jsonb_ops
+        Index(
+            "ix_tasks_reminder_config_path",
+            "reminder_config",
+            postgresql_using="gin",
+            postgresql_ops={"reminder_config": "jsonb_path_ops"},
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    user_id: int = Field(foreign_key="users.id", index=True)
+    user_id: int = Field(foreign_key="users.id")
     title: str = Field(min_length=1, max_length=200)
     description: str = Field(default="", max_length=2000)
     priority: PriorityEnum = Field(
@@ -108,12 +130,20 @@ class ConversationHistory(SQLModel, table=True):
     """Conversation history model for AI chat sessions."""
 
     __tablename__ = "conversation_history"
+    __table_args__ = (
+        # Serves "last N messages for a user" with a forward index scan
+        Index(
+            "ix_conversation_history_user_id_created_at",
+            "user_id",
+            text("created_at DESC"),
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    user_id: int = Field(foreign_key="users.id", index=True)
+    user_id: int = Field(foreign_key="users.id")
     role: str = Field(max_length=20)  # "user" or "assistant"
     content: str = Field(sa_column=Column(Text))
-    created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
 
     # Relationship
     user: Optional[User] = Relationship(back_populates="conversation_history")
@@ -145,6 +175,14 @@ class RecurrencePattern(SQLModel, table=True):
     """
 
     __tablename__ = "recurrence_patterns"
+    __table_args__ = (
+        Index(
+            "ix_recurrence_patterns_task_template_path",
+            "task_template",
+            postgresql_using="gin",
+            postgresql_ops={"task_template": "jsonb_path_ops"},
+        ),
+    )
 
     id: UUID = Field(
         default_factory=uuid4,
@@ -188,11 +226,20 @@ class Reminder(SQLModel, table=True):
     """
 
     __tablename__ = "reminders"
+    __table_args__ = (
+        # Query with @>, e.g. notification_channels @> '{"channels": ["email"]}'
+        Index(
+            "ix_reminders_notification_channels_path",
+            "notification_channels",
+            postgresql_using="gin",
+            postgresql_ops={"notification_channels": "jsonb_path_ops"},
+        ),
+    )
 
     id: UUID = Field(
-        default_factory=uuid4,
-        sa_column=Column(PostgreSQL_UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
-    )
+        default_factory=uuid7,
+        sa_column=Column(PostgreSQL_UUID(as_uuid=True), primary_key=True, default=uuid7)
+    )  # UUIDv7: time-ordered, keeps inserts at the right edge of the PK index
     task_id: UUID = Field(
         sa_column=Column(PostgreSQL_UUID(as_uuid=True), nullable=False)
     )
@@ -219,25 +266,44 @@ class Event(SQLModel, table=True):
     Phase: Phase V - Event-Driven Architecture
 
     This model maps to the events table created in migration 004 (T-510).
-    Stores all system events for audit trail and event replay.
+    Stores all system events for audit trail and event replay. Migration 009
+    range-partitions the table by month on created_at, so the primary key is
+    (id, created_at).
 
     Attributes:
-        id: UUID primary key
+        id: UUID (primary key together with created_at)
         event_type: Event type identifier (e.g., task.created)
         aggregate_type: Type of entity (e.g., task, reminder)
         aggregate_id: UUID of the entity
         user_id: Optional UUID of the user who triggered the event
         payload: JSONB event data
-        metadata: Optional JSONB metadata
-        created_at: Event timestamp
+        event_metadata: Optional JSONB metadata (column "metadata"; the
+            attribute name is reserved by the declarative API)
+        created_at: Event timestamp (partition key)
     """
 
     __tablename__ = "events"
+    __table_args__ = (
+        Index(
+            "ix_events_payload_path",
+            "payload",
+            postgresql_using="gin",
+            postgresql_ops={"payload": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_events_metadata_path",
+            "metadata",
+            postgresql_using="gin",
+            postgresql_ops={"metadata": "jsonb_path_ops"},
+        ),
+        # Monthly range partitions (see app.db.partitions)
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     id: UUID = Field(
-        default_factory=uuid4,
-        sa_column=Column(PostgreSQL_UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
-    )
+        default_factory=uuid7,
+        sa_column=Column(PostgreSQL_UUID(as_uuid=True), primary_key=True, default=uuid7)
+    )  # UUIDv7: time-ordered, keeps inserts at the right edge of the PK index
     event_type: str = Field(max_length=50, nullable=False)
     aggregate_type: str = Field(max_length=50, nullable=False)
     aggregate_id: UUID = Field(
@@ -250,11 +316,12 @@ class Event(SQLModel, table=True):
     payload: Dict[str, Any] = Field(
         sa_column=Column(JSONB, nullable=False)
     )
-    metadata: Optional[Dict[str, Any]] = Field(
+    event_metadata: Optional[Dict[str, Any]] = Field(
         default=None,
-        sa_column=Column(JSONB, nullable=True)
+        sa_column=Column("metadata", JSONB, nullable=True)
     )
-    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    # Partition key, so part of the primary key (id, created_at)
+    created_at: datetime = Field(default_factory=datetime.utcnow, primary_key=True)
 
 
 class Notification(SQLModel, table=True):
@@ -281,9 +348,9 @@ class Notification(SQLModel, table=True):
     __tablename__ = "notifications"
 
     id: UUID = Field(
-        default_factory=uuid4,
-        sa_column=Column(PostgreSQL_UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
-    )
+        default_factory=uuid7,
+        sa_column=Column(PostgreSQL_UUID(as_uuid=True), primary_key=True, default=uuid7)
+    )  # UUIDv7: time-ordered, keeps inserts at the right edge of the PK index
     reminder_id: UUID = Field(
         sa_column=Column(PostgreSQL_UUID(as_uuid=True), nullable=False)
     )
@@ -301,3 +368,39 @@ class Notification(SQLModel, table=True):
     last_error: Optional[str] = Field(default=None, sa_column=Column(Text, nullable=True))
     created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
     sent_at: Optional[datetime] = Field(default=None, nullable=True)
+
+
+class EventOutbox(SQLModel, table=True):
+    """Transactional outbox for CloudEvents awaiting publication.
+
+    Rows are written in the same transaction as the change that produced
+    them and deleted by the outbox relay (app.events.outbox) once published.
+
+    Attributes:
+        id: Monotonic id; the relay claims rows in id order
+        topic: Destination topic (task-events or reminders)
+        event_type: Event schema class name used to rebuild the CloudEvent
+        payload: JSONB CloudEvent body
+        attempts: Failed publish attempts; dead-lettered at OUTBOX_MAX_ATTEMPTS
+        created_at: Creation timestamp
+    """
+
+    __tablename__ = "events_outbox"
+
+    id: Optional[int] = Field(
+        default=None,
+        sa_column=Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True)
+    )
+    topic: str = Field(sa_column=Column(Text, nullable=False))
+    event_type: str = Field(max_length=100, nullable=False)
+    payload: Dict[str, Any] = Field(
+        sa_column=Column(JSONB, nullable=False)
+    )
+    attempts: int = Field(
+        default=0,
+        sa_column=Column(Integer, nullable=False, server_default=text("0"))
+    )
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=Column(DateTime(timezone=True), nullable=False, server_default=text("now()"))
+    )
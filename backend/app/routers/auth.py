@@ -1,45 +1,58 @@
 """Authentication router for user registration and login."""
 
-from fastapi import APIRouter, Depends, HTTPException, status, Response
+from typing import Optional
+from fastapi import APIRouter, Cookie, Depends, HTTPException, status, Response
 from sqlmodel import Session, select
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import bindparam, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from app.database import get_session
 from app.models import User
 from app.schemas import UserRegister, UserLogin, UserResponse
-from app.auth import hash_password, verify_password, create_jwt
+from app.auth import HASH_POOL, hash_password, verify_password, create_jwt, decode_jwt, revoke_jwt
+from app.dependencies import invalidate_cached_user
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
+# Built once and reused per login; served by the ux_users_email_lower index
+_USER_BY_EMAIL = select(User).where(func.lower(User.email) == bindparam("email"))
 
+
+# register and login are plain def: FastAPI runs them in its threadpool, so
+# the blocking session calls stay off the event loop. bcrypt still runs on
+# HASH_POOL, which caps how many hashes run at once.
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def register(
+def register(
     user_data: UserRegister,
     response: Response,
     session: Session = Depends(get_session)
 ):
     """Register a new user."""
-    # Hash the password
-    hashed_password = hash_password(user_data.password)
-
-    # Create user
-    user = User(
-        email=user_data.email.lower(),  # Store email in lowercase
-        hashed_password=hashed_password
+    # bcrypt is CPU-bound: hash on the dedicated pool
+    hashed_password = HASH_POOL.submit(hash_password, user_data.password).result()
+
+    # Create user: a duplicate email (on any unique email index) returns no
+    # row instead of raising IntegrityError and rolling back
+    statement = (
+        pg_insert(User)
+        .values(
+            email=user_data.email.lower(),  # Store email in lowercase
+            hashed_password=hashed_password
+        )
+        .on_conflict_do_nothing()
+        .returning(User)
     )
+    user = session.execute(statement).scalar_one_or_none()
 
-    try:
-        session.add(user)
-        session.commit()
-        session.refresh(user)
-    except IntegrityError:
-        session.rollback()
+    if user is None:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Email already registered"
         )
 
+    session.commit()
+
     # Generate JWT token
-    token = create_jwt(user.id)
+    token = create_jwt(user.id, user.email)
 
     # Set HTTP-only cookie
     # For local development: no domain set (allows 127.0.0.1 and localhost to both work)
@@ -57,25 +70,29 @@ async def register(
 
 
 @router.post("/login", response_model=UserResponse)
-async def login(
+def login(
     credentials: UserLogin,
     response: Response,
     session: Session = Depends(get_session)
 ):
     """Login a user."""
     # Find user by email
-    statement = select(User).where(User.email == credentials.email.lower())
-    user = session.exec(statement).first()
+    user = session.exec(
+        _USER_BY_EMAIL, params={"email": credentials.email.lower()}
+    ).first()
 
     # Verify credentials (same error for wrong email or password - security)
-    if not user or not verify_password(credentials.password, user.hashed_password):
+    # bcrypt is CPU-bound, so run it on the hashing pool
+    if not user or not HASH_POOL.submit(
+        verify_password, credentials.password, user.hashed_password
+    ).result():
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials"
         )
 
     # Generate JWT token
-    token = create_jwt(user.id)
+    token = create_jwt(user.id, user.email)
 
     # Set HTTP-only cookie
     # For local development: no domain set (allows 127.0.0.1 and localhost to both work)
@@ -93,8 +110,14 @@ async def login(
 
 
 @router.post("/logout")
-async def logout(response: Response):
-    """Logout a user by clearing the JWT cookie."""
+async def logout(response: Response, access_token: Optional[str] = Cookie(None)):
+    """Logout a user by revoking and clearing the JWT cookie."""
+    if access_token:
+        payload = decode_jwt(access_token)
+        if payload and payload.get("user_id"):
+            invalidate_cached_user(payload["user_id"])
+        revoke_jwt(access_token)
+
     response.delete_cookie(
         key="access_token",
         httponly=True,
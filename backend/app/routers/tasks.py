@@ -7,20 +7,35 @@ This router emits CloudEvents for all task domain events:
 - task.created: When a new task is created
 - task.updated: When a task is updated (fields or completion status)
 - task.deleted: When a task is deleted
+
+Events are written to the events_outbox table in the same transaction as
+the task change and published by the outbox relay (app.events.outbox), so
+no event is lost if the broker is down and responses never wait on it.
+
+Update, toggle and delete return 404 both for missing tasks and for tasks
+owned by another user (previously 403), so task ids are not disclosed.
+
+Handlers are plain ``def``: they only make synchronous Session calls, so
+FastAPI runs them in its threadpool and the event loop is never blocked on
+a database round-trip.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import delete, insert, not_, tuple_, update
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, select
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Optional
 import logging
 
 from app.database import get_session
-from app.models import Task, User
+from app.models import Task
 from app.schemas import TaskCreate, TaskUpdate, TaskResponse
-from app.dependencies import get_current_user
+from app.dependencies import get_current_user_id
 
 # T-521: Import event publishing components
-from app.events.publisher import get_event_publisher, EventPublisher
+from app.events.outbox import outbox_task_event, outbox_reminder_event
 from app.events.schemas import (
     TaskCreatedEvent,
     TaskCreatedData,
@@ -39,376 +54,465 @@ router = APIRouter(prefix="/tasks", tags=["tasks"])
 logger = logging.getLogger(__name__)
 
 
+# Keyset pagination for get_tasks
+TASKS_PAGE_SIZE = 50
+TASKS_MAX_PAGE_SIZE = 200
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Columns read by get_tasks: fetched as plain rows, no ORM instances
+TASK_COLUMNS = (
+    Task.id,
+    Task.user_id,
+    Task.title,
+    Task.description,
+    Task.priority,
+    Task.is_complete,
+    Task.created_at,
+    Task.updated_at,
+    Task.reminder_time,
+    Task.reminder_config,
+)
+
+
+def _encode_cursor(created_at: datetime, task_id: int) -> str:
+    """Encode a task's (created_at, id) sort key as an opaque page cursor."""
+    return f"{created_at.isoformat()},{task_id}"
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode a page cursor; raises 400 if it is malformed.
+
+    created_at is stored as naive UTC, so a cursor with a UTC offset is
+    converted to naive UTC before it is compared.
+    """
+    try:
+        created_at, task_id = cursor.rsplit(",", 1)
+        created_at = datetime.fromisoformat(created_at)
+        if created_at.tzinfo is not None:
+            created_at = created_at.astimezone(timezone.utc).replace(tzinfo=None)
+        return created_at, int(task_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+# T-522: Default channels, shared instead of allocating a list per call
+_DEFAULT_CHANNELS = ("email",)
+
+
 # T-522: Helper function to extract notification channels
-def _get_notification_channels(reminder_config: dict | None) -> list[str]:
+def _get_notification_channels(reminder_config: dict | None) -> tuple[str, ...]:
     """Extract notification channels from reminder_config.
 
     Args:
         reminder_config: JSONB reminder configuration
 
     Returns:
-        List of notification channels (defaults to ['email'])
+        Tuple of notification channels (defaults to ('email',))
     """
     if not reminder_config:
-        return ["email"]
-    return reminder_config.get("channels", ["email"])
+        return _DEFAULT_CHANNELS
+    return tuple(reminder_config.get("channels", _DEFAULT_CHANNELS))
+
+
+# Outgoing events are built from values we just read from or wrote to the
+# database, so they skip Pydantic validation (inbound request bodies are
+# still validated via TaskCreate/TaskUpdate)
+def _make_event(event_cls, data_cls, subject: str, **data):
+    """Build a CloudEvent for a trusted payload with model_construct."""
+    return event_cls.model_construct(
+        source="/api/tasks",
+        subject=subject,
+        data=data_cls.model_construct(**data)
+    )
+
+
+# T-522: Reminder event builders
+def _reminder_scheduled_event(task: Task) -> TaskReminderScheduledEvent:
+    """Build reminder.scheduled for a task's current reminder_time."""
+    return _make_event(
+        TaskReminderScheduledEvent,
+        TaskReminderScheduledData,
+        subject=f"task/{task.id}",
+        task_id=task.id,
+        user_id=task.user_id,
+        scheduled_time=task.reminder_time,
+        notification_channels=_get_notification_channels(task.reminder_config)
+    )
+
+
+def _reminder_removed_event(task: Task) -> ReminderCancelledEvent:
+    """Build reminder.cancelled for a reminder cleared by an update."""
+    return _make_event(
+        ReminderCancelledEvent,
+        ReminderCancelledData,
+        subject=f"task/{task.id}",
+        task_id=task.id,
+        user_id=task.user_id,
+        reason="reminder_removed",
+        cancelled_at=datetime.utcnow()
+    )
+
+
+# T-522: (had reminder, has reminder) -> (action, event builder)
+_REMINDER_TRANSITIONS = {
+    (True, False): ("cancelled", _reminder_removed_event),
+    (False, True): ("scheduled", _reminder_scheduled_event),
+    (True, True): ("rescheduled", _reminder_scheduled_event),
+}
 
 
-@router.get("/", response_model=list[TaskResponse])
-async def get_tasks(
-    current_user: User = Depends(get_current_user),
+# response_model=None: the rows are serialized directly (see below);
+# TaskResponse still documents the body in the OpenAPI schema
+@router.get("/", response_model=None, responses={200: {"model": list[TaskResponse]}})
+def get_tasks(
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header"),
+    limit: int = Query(TASKS_PAGE_SIZE, ge=1, le=TASKS_MAX_PAGE_SIZE),
+    current_user_id: int = Depends(get_current_user_id),
     session: Session = Depends(get_session)
 ):
-    """Get all tasks for the current user."""
+    """Get one page of the current user's tasks, newest first.
+
+    Uses keyset pagination on (created_at, id): each page is a range scan of
+    ix_tasks_user_created, however many tasks the user has. When more tasks
+    remain, the cursor for the next page is returned in X-Next-Cursor.
+    """
     statement = (
-        select(Task)
-        .where(Task.user_id == current_user.id)
-        .order_by(Task.created_at.desc())
+        select(*TASK_COLUMNS)
+        .where(Task.user_id == current_user_id)
+        .order_by(Task.created_at.desc(), Task.id.desc())
+        .limit(limit + 1)  # One extra row tells us whether a next page exists
     )
-    tasks = session.exec(statement).all()
-    return tasks
+    if cursor:
+        statement = statement.where(
+            tuple_(Task.created_at, Task.id) < tuple_(*_decode_cursor(cursor))
+        )
+
+    # Read-only list: the TASK_COLUMNS row mappings already have the
+    # TaskResponse shape, so they are encoded with orjson as-is instead of
+    # being validated and re-serialized through the response model
+    rows = session.execute(statement).mappings().all()
+    headers = {}
+    if len(rows) > limit:
+        rows = rows[:limit]
+        headers[NEXT_CURSOR_HEADER] = _encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
+    return ORJSONResponse([dict(row) for row in rows], headers=headers)
 
 
 @router.post("/", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
-async def create_task(
+def create_task(
     task_data: TaskCreate,
-    current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session),
-    publisher: EventPublisher = Depends(get_event_publisher)  # T-521: Inject event publisher
+    current_user_id: int = Depends(get_current_user_id),
+    session: Session = Depends(get_session)
 ):
     """Create a new task for the current user.
 
     T-521: Emits task.created event after successful task creation.
     T-522: Emits reminder.scheduled event if reminder_time is set.
     """
-    task = Task(
-        **task_data.model_dump(),
-        user_id=current_user.id
+    # INSERT ... RETURNING: the row comes back with the insert, no refresh SELECT
+    statement = (
+        insert(Task)
+        .values(**task_data.model_dump(), user_id=current_user_id)
+        .returning(Task)
     )
-
-    session.add(task)
-    session.commit()
-    session.refresh(task)
+    try:
+        task = session.execute(statement).scalar_one()
+    except IntegrityError:
+        # get_current_user_id trusts the token without a user lookup, so a
+        # valid token for a deleted user only fails here, on the user_id
+        # foreign key (the other columns were validated by TaskCreate)
+        session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found"
+        )
 
     # T-521: Publish task.created event
     try:
-        event = TaskCreatedEvent(
-            source="/api/tasks",
+        event = _make_event(
+            TaskCreatedEvent,
+            TaskCreatedData,
             subject=f"task/{task.id}",
-            data=TaskCreatedData(
-                task_id=task.id,
-                user_id=task.user_id,
-                title=task.title,
-                description=task.description,
-                priority=task.priority
-            )
+            task_id=task.id,
+            user_id=task.user_id,
+            title=task.title,
+            description=task.description,
+            priority=task.priority
         )
-        await publisher.publish_task_event(event)
-        logger.info(f"Published task.created event for task {task.id}")
+        outbox_task_event(session, event)
+        logger.info(f"Queued task.created event for task {task.id}")
     except Exception as e:
         # Log error but don't fail the request
-        # Event publishing is best-effort; task was successfully created
+        # A malformed event must not roll back the task write
         logger.error(
-            f"Failed to publish task.created event for task {task.id}: {e}",
+            f"Failed to queue task.created event for task {task.id}: {e}",
             exc_info=True
         )
 
     # T-522: Publish reminder.scheduled event if reminder_time is set
     if task.reminder_time:
         try:
-            reminder_event = TaskReminderScheduledEvent(
-                source="/api/tasks",
-                subject=f"task/{task.id}",
-                data=TaskReminderScheduledData(
-                    task_id=task.id,
-                    user_id=task.user_id,
-                    scheduled_time=task.reminder_time,
-                    notification_channels=_get_notification_channels(task.reminder_config)
-                )
-            )
-            await publisher.publish_reminder_event(reminder_event)
+            outbox_reminder_event(session, _reminder_scheduled_event(task))
             logger.info(
-                f"Published reminder.scheduled event for task {task.id} "
+                f"Queued reminder.scheduled event for task {task.id} "
                 f"(scheduled_time: {task.reminder_time})"
             )
         except Exception as e:
             logger.error(
-                f"Failed to publish reminder.scheduled event for task {task.id}: {e}",
+                f"Failed to queue reminder.scheduled event for task {task.id}: {e}",
                 exc_info=True
             )
 
+    # Task write and outbox rows commit atomically
+    session.commit()
+
     return task
 
 
 @router.put("/{task_id}", response_model=TaskResponse)
-async def update_task(
+def update_task(
     task_id: int,
     task_data: TaskUpdate,
-    current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session),
-    publisher: EventPublisher = Depends(get_event_publisher)  # T-521: Inject event publisher
+    current_user_id: int = Depends(get_current_user_id),
+    session: Session = Depends(get_session)
 ):
     """Update a task (with ownership check).
 
     T-521: Emits task.updated event with change tracking after successful update.
     T-522: Emits reminder.scheduled or reminder.cancelled based on reminder_time changes.
     """
-    task = session.get(Task, task_id)
-
-    if not task:
+    update_data = task_data.model_dump(exclude_unset=True)
+    fields = list(update_data)
+
+    # Ownership check and previous values in one locked read (a Core row, so
+    # the session's cached Task instance is not touched)
+    previous = session.execute(
+        select(Task.id, *(getattr(Task, key) for key in fields))
+        .where(Task.id == task_id, Task.user_id == current_user_id)
+        .with_for_update()
+    ).one_or_none()
+
+    if previous is None:
+        # Missing and not-owned tasks are indistinguishable here
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found"
         )
 
-    if task.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to update this task"
-        )
+    # UPDATE ... RETURNING: the new row comes back with the update.
+    # populate_existing overwrites a Task already in the identity map, which
+    # would otherwise be returned with its stale values.
+    statement = (
+        update(Task)
+        .where(Task.id == task_id)
+        .values(**update_data, updated_at=datetime.utcnow())
+        .returning(Task)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+    task = session.execute(statement).scalar_one()
 
     # T-521: Capture previous values for change tracking
     # T-522: Specifically track reminder_time changes
-    previous_reminder_time = task.reminder_time
+    previous_row = previous._asdict()
+    previous_reminder_time = previous_row.get("reminder_time")
 
-    update_data = task_data.model_dump(exclude_unset=True)
-    changes = {}
-    previous_values = {}
-
-    for key, value in update_data.items():
-        old_value = getattr(task, key, None)
-        if old_value != value:
-            changes[key] = value
-            previous_values[key] = old_value
-            setattr(task, key, value)
-
-    task.updated_at = datetime.utcnow()
-    session.add(task)
-    session.commit()
-    session.refresh(task)
+    changes = {
+        key: value for key, value in update_data.items() if previous_row[key] != value
+    }
+    previous_values = {key: previous_row[key] for key in changes}
 
     # T-521: Publish task.updated event if there were changes
     if changes:
         try:
-            event = TaskUpdatedEvent(
-                source="/api/tasks",
+            event = _make_event(
+                TaskUpdatedEvent,
+                TaskUpdatedData,
                 subject=f"task/{task.id}",
-                data=TaskUpdatedData(
-                    task_id=task.id,
-                    user_id=task.user_id,
-                    changes=changes,
-                    previous_values=previous_values
-                )
+                task_id=task.id,
+                user_id=task.user_id,
+                changes=changes,
+                previous_values=previous_values
             )
-            await publisher.publish_task_event(event)
+            outbox_task_event(session, event)
             logger.info(
-                f"Published task.updated event for task {task.id} "
+                f"Queued task.updated event for task {task.id} "
                 f"(changed fields: {list(changes.keys())})"
             )
         except Exception as e:
             logger.error(
-                f"Failed to publish task.updated event for task {task.id}: {e}",
+                f"Failed to queue task.updated event for task {task.id}: {e}",
                 exc_info=True
             )
 
     # T-522: Handle reminder scheduling changes
-    reminder_time_changed = "reminder_time" in changes
-
-    if reminder_time_changed:
-        # Reminder was removed (was set, now None)
-        if previous_reminder_time and not task.reminder_time:
-            try:
-                cancel_event = ReminderCancelledEvent(
-                    source="/api/tasks",
-                    subject=f"task/{task.id}",
-                    data=ReminderCancelledData(
-                        task_id=task.id,
-                        user_id=task.user_id,
-                        reason="reminder_removed",
-                        cancelled_at=datetime.utcnow()
-                    )
-                )
-                await publisher.publish_reminder_event(cancel_event)
-                logger.info(
-                    f"Published reminder.cancelled event for task {task.id} "
-                    f"(reason: reminder_removed)"
-                )
-            except Exception as e:
-                logger.error(
-                    f"Failed to publish reminder.cancelled event for task {task.id}: {e}",
-                    exc_info=True
-                )
-
-        # Reminder was added or changed (new value is not None)
-        elif task.reminder_time:
+    if "reminder_time" in changes:
+        transition = _REMINDER_TRANSITIONS.get(
+            (bool(previous_reminder_time), bool(task.reminder_time))
+        )
+        if transition:
+            action, build_event = transition
             try:
-                schedule_event = TaskReminderScheduledEvent(
-                    source="/api/tasks",
-                    subject=f"task/{task.id}",
-                    data=TaskReminderScheduledData(
-                        task_id=task.id,
-                        user_id=task.user_id,
-                        scheduled_time=task.reminder_time,
-                        notification_channels=_get_notification_channels(task.reminder_config)
-                    )
-                )
-                await publisher.publish_reminder_event(schedule_event)
-                action = "rescheduled" if previous_reminder_time else "scheduled"
+                outbox_reminder_event(session, build_event(task))
                 logger.info(
-                    f"Published reminder.scheduled event for task {task.id} "
+                    f"Queued reminder event for task {task.id} "
                     f"({action}, scheduled_time: {task.reminder_time})"
                 )
             except Exception as e:
                 logger.error(
-                    f"Failed to publish reminder.scheduled event for task {task.id}: {e}",
+                    f"Failed to queue reminder event ({action}) for task {task.id}: {e}",
                     exc_info=True
                 )
 
+    # Task write and outbox rows commit atomically
+    session.commit()
+
     return task
 
 
 @router.patch("/{task_id}/toggle", response_model=TaskResponse)
-async def toggle_task(
+def toggle_task(
     task_id: int,
-    current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session),
-    publisher: EventPublisher = Depends(get_event_publisher)  # T-521: Inject event publisher
+    current_user_id: int = Depends(get_current_user_id),
+    session: Session = Depends(get_session)
 ):
     """Toggle task completion status.
 
     T-521: Emits task.updated event when completion status changes.
     """
-    task = session.get(Task, task_id)
+    # UPDATE ... RETURNING with ownership in the WHERE clause: flips the flag
+    # and returns the new row in one statement
+    statement = (
+        update(Task)
+        .where(Task.id == task_id, Task.user_id == current_user_id)
+        .values(is_complete=not_(Task.is_complete), updated_at=datetime.utcnow())
+        .returning(Task)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+    task = session.execute(statement).scalar_one_or_none()
 
     if not task:
+        # Missing and not-owned tasks are indistinguishable here
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found"
         )
 
-    if task.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to update this task"
-        )
-
     # T-521: Capture previous completion status
-    previous_is_complete = task.is_complete
-    task.is_complete = not task.is_complete
-    task.updated_at = datetime.utcnow()
-
-    session.add(task)
-    session.commit()
-    session.refresh(task)
+    previous_is_complete = not task.is_complete
 
     # T-521: Publish task.updated event for completion status change
     try:
-        event = TaskUpdatedEvent(
-            source="/api/tasks",
+        event = _make_event(
+            TaskUpdatedEvent,
+            TaskUpdatedData,
             subject=f"task/{task.id}",
-            data=TaskUpdatedData(
-                task_id=task.id,
-                user_id=task.user_id,
-                changes={"is_complete": task.is_complete},
-                previous_values={"is_complete": previous_is_complete}
-            )
+            task_id=task.id,
+            user_id=task.user_id,
+            changes={"is_complete": task.is_complete},
+            previous_values={"is_complete": previous_is_complete}
         )
-        await publisher.publish_task_event(event)
+        outbox_task_event(session, event)
         logger.info(
-            f"Published task.updated event for task {task.id} "
+            f"Queued task.updated event for task {task.id} "
             f"(completion: {previous_is_complete} -> {task.is_complete})"
         )
     except Exception as e:
         logger.error(
-            f"Failed to publish task.updated event for task {task.id}: {e}",
+            f"Failed to queue task.updated event for task {task.id}: {e}",
             exc_info=True
         )
 
+    # Task write and outbox rows commit atomically
+    session.commit()
+
     return task
 
 
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_task(
+def delete_task(
     task_id: int,
-    current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session),
-    publisher: EventPublisher = Depends(get_event_publisher)  # T-521: Inject event publisher
+    current_user_id: int = Depends(get_current_user_id),
+    session: Session = Depends(get_session)
 ):
     """Delete a task.
 
     T-521: Emits task.deleted event after successful deletion.
     T-522: Emits reminder.cancelled if task had a reminder.
     """
-    task = session.get(Task, task_id)
+    # DELETE ... RETURNING with ownership in the WHERE clause. Only the
+    # columns the events need come back, as a plain row (no ORM instance).
+    # T-521: task details for the task.deleted payload
+    # T-522: reminder_time for the cancellation event
+    statement = (
+        delete(Task)
+        .where(Task.id == task_id, Task.user_id == current_user_id)
+        .returning(Task.id, Task.user_id, Task.title, Task.is_complete, Task.reminder_time)
+        .execution_options(synchronize_session=False)
+    )
+    row = session.execute(statement).one_or_none()
 
-    if not task:
+    if row is None:
+        # Missing and not-owned tasks are indistinguishable here
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found"
         )
 
-    if task.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to delete this task"
-        )
-
-    # T-521: Capture task details before deletion for event payload
-    # T-522: Also capture reminder_time for cancellation event
-    task_id_for_event = task.id
-    user_id_for_event = task.user_id
-    title_for_event = task.title
-    was_complete_for_event = task.is_complete
-    had_reminder = task.reminder_time is not None
-
-    session.delete(task)
-    session.commit()
+    task_id_for_event = row.id
+    user_id_for_event = row.user_id
+    title_for_event = row.title
+    was_complete_for_event = row.is_complete
+    had_reminder = row.reminder_time is not None
 
     # T-521: Publish task.deleted event
     try:
-        event = TaskDeletedEvent(
-            source="/api/tasks",
+        event = _make_event(
+            TaskDeletedEvent,
+            TaskDeletedData,
             subject=f"task/{task_id_for_event}",
-            data=TaskDeletedData(
-                task_id=task_id_for_event,
-                user_id=user_id_for_event,
-                title=title_for_event,
-                was_complete=was_complete_for_event
-            )
+            task_id=task_id_for_event,
+            user_id=user_id_for_event,
+            title=title_for_event,
+            was_complete=was_complete_for_event
         )
-        await publisher.publish_task_event(event)
+        outbox_task_event(session, event)
         logger.info(
-            f"Published task.deleted event for task {task_id_for_event} "
+            f"Queued task.deleted event for task {task_id_for_event} "
             f"(title: '{title_for_event}')"
         )
     except Exception as e:
         logger.error(
-            f"Failed to publish task.deleted event for task {task_id_for_event}: {e}",
+            f"Failed to queue task.deleted event for task {task_id_for_event}: {e}",
             exc_info=True
         )
 
     # T-522: Publish reminder.cancelled if task had a reminder
     if had_reminder:
         try:
-            cancel_event = ReminderCancelledEvent(
-                source="/api/tasks",
+            cancel_event = _make_event(
+                ReminderCancelledEvent,
+                ReminderCancelledData,
                 subject=f"task/{task_id_for_event}",
-                data=ReminderCancelledData(
-                    task_id=task_id_for_event,
-                    user_id=user_id_for_event,
-                    reason="task_deleted",
-                    cancelled_at=datetime.utcnow()
-                )
+                task_id=task_id_for_event,
+                user_id=user_id_for_event,
+                reason="task_deleted",
+                cancelled_at=datetime.utcnow()
             )
-            await publisher.publish_reminder_event(cancel_event)
+            outbox_reminder_event(session, cancel_event)
             logger.info(
-                f"Published reminder.cancelled event for task {task_id_for_event} "
+                f"Queued reminder.cancelled event for task {task_id_for_event} "
                 f"(reason: task_deleted)"
             )
         except Exception as e:
             logger.error(
-                f"Failed to publish reminder.cancelled event for task {task_id_for_event}: {e}",
+                f"Failed to queue reminder.cancelled event for task {task_id_for_event}: {e}",
                 exc_info=True
             )
 
+    # Task write and outbox rows commit atomically
+    session.commit()
+
     return None
@@ -4,22 +4,42 @@ Task: T-522 - Reminder Scheduling Logic (Backend)
 Added reminder_time and reminder_config fields to task schemas.
 """
 
-from pydantic import BaseModel, EmailStr, Field, validator
+from enum import Enum
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, field_validator
 from datetime import datetime
-from typing import Optional, Literal, Dict, Any
+from typing import Annotated, Literal, Optional, Any
+
+# Registration only; checked by pydantic-core's compiled regex engine
+EMAIL_RE = r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$"
+Email = Annotated[str, Field(pattern=EMAIL_RE, max_length=254)]
+
+# Three fixed values: validated by set lookup rather than a regex match
+Priority = Literal["high", "medium", "low"]
+
+
+def _require_object(value: Any) -> Any:
+    """Accept a JSON object without validating each key and value."""
+    if value is not None and not isinstance(value, dict):
+        raise ValueError('reminder_config must be a JSON object')
+    return value
+
+
+# Opaque JSONB blob: only the top-level type is checked (O(1))
+ReminderConfig = Annotated[Optional[Any], AfterValidator(_require_object)]
 
 
 class UserRegister(BaseModel):
     """Schema for user registration."""
 
-    email: EmailStr
-    password: str = Field(min_length=8)
+    email: Email
+    password: Annotated[str, Field(min_length=8)]
 
 
 class UserLogin(BaseModel):
     """Schema for user login."""
 
-    email: EmailStr
+    # No pattern: accounts registered under EmailStr may not match EMAIL_RE
+    email: Annotated[str, Field(max_length=254)]
     password: str
 
 
@@ -37,14 +57,14 @@ class TaskCreate(BaseModel):
     T-522: Added reminder_time and reminder_config for reminder scheduling.
     """
 
-    title: str = Field(min_length=1, max_length=200)
-    description: str = Field(default="", max_length=2000)
-    priority: str = Field(default="medium", pattern="^(high|medium|low)$")
-    reminder_time: Optional[datetime] = Field(default=None, description="When to send reminder")
-    reminder_config: Optional[Dict[str, Any]] = Field(
-        default=None,
-        description="Reminder configuration (e.g., {'channels': ['email', 'push']})"
-    )
+    title: Annotated[str, Field(min_length=1, max_length=200)]
+    description: Annotated[str, Field(max_length=2000)] = ""
+    priority: Priority = "medium"
+    reminder_time: Annotated[Optional[datetime], Field(description="When to send reminder")] = None
+    reminder_config: Annotated[
+        ReminderConfig,
+        Field(description="Reminder configuration (e.g., {'channels': ['email', 'push']})")
+    ] = None
 
 
 class TaskUpdate(BaseModel):
@@ -53,14 +73,14 @@ class TaskUpdate(BaseModel):
     T-522: Added reminder_time and reminder_config for reminder scheduling.
     """
 
-    title: Optional[str] = Field(None, min_length=1, max_length=200)
-    description: Optional[str] = Field(None, max_length=2000)
-    priority: Optional[str] = Field(None, pattern="^(high|medium|low)$")
-    reminder_time: Optional[datetime] = Field(None, description="When to send reminder")
-    reminder_config: Optional[Dict[str, Any]] = Field(
-        None,
-        description="Reminder configuration (e.g., {'channels': ['email', 'push']})"
-    )
+    title: Annotated[Optional[str], Field(min_length=1, max_length=200)] = None
+    description: Annotated[Optional[str], Field(max_length=2000)] = None
+    priority: Optional[Priority] = None
+    reminder_time: Annotated[Optional[datetime], Field(description="When to send reminder")] = None
+    reminder_config: Annotated[
+        ReminderConfig,
+        Field(description="Reminder configuration (e.g., {'channels': ['email', 'push']})")
+    ] = None
 
 
 class TaskResponse(BaseModel):
@@ -78,7 +98,7 @@ class TaskResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     reminder_time: Optional[datetime] = None
-    reminder_config: Optional[Dict[str, Any]] = None
+    reminder_config: Optional[Any] = None
 
 
 # Phase III: Chat Schemas
@@ -86,60 +106,72 @@ class TaskResponse(BaseModel):
 class ChatRequest(BaseModel):
     """Request schema for chat endpoint."""
 
-    message: str = Field(
-        ...,
+    model_config = ConfigDict(
+        extra='forbid',  # Reject unknown keys instead of scanning and dropping them
+        defer_build=True,  # Core schema is built in the startup hook, not at import
+        json_schema_extra={
+            "example": {
+                "message": "Create a task to buy groceries tomorrow"
+            }
+        }
+    )
+
+    message: Annotated[str, Field(
         min_length=1,
         max_length=1000,
         description="Natural language message from the user"
-    )
+    )]
 
-    @validator('message')
-    def message_not_empty(cls, v):
+    @field_validator('message', mode='after')
+    @classmethod
+    def message_not_empty(cls, v: str) -> str:
         """Validate that message is not just whitespace."""
         if not v or not v.strip():
             raise ValueError('Message cannot be empty or whitespace only')
         return v.strip()
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "message": "Create a task to buy groceries tomorrow"
-            }
-        }
+
+class ChatAction(str, Enum):
+    """Action types reported in ChatMetadata."""
+
+    TASK_CREATED = "task_created"
+    TASK_UPDATED = "task_updated"
+    TASK_DELETED = "task_deleted"
+    TASK_COMPLETED = "task_completed"
+    TASK_UNCOMPLETED = "task_uncompleted"
+    TASKS_LISTED = "tasks_listed"
+    NO_ACTION = "no_action"
 
 
 class ChatMetadata(BaseModel):
     """Metadata about the action performed."""
 
-    action: Literal[
-        "task_created",
-        "task_updated",
-        "task_deleted",
-        "task_completed",
-        "task_uncompleted",
-        "tasks_listed",
-        "no_action"
-    ] = Field(description="Action type performed")
-    task_id: Optional[int] = Field(default=None, description="ID of the task operated on")
-    count: Optional[int] = Field(default=None, description="Number of tasks returned")
-
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        use_enum_values=True,  # Store action as its plain string value
+        frozen=True,
+        extra='ignore',
+        defer_build=True,
+        json_schema_extra={
             "example": {
                 "action": "task_created",
                 "task_id": 42
             }
         }
+    )
+
+    action: Annotated[ChatAction, Field(description="Action type performed")]
+    task_id: Annotated[Optional[int], Field(description="ID of the task operated on")] = None
+    count: Annotated[Optional[int], Field(description="Number of tasks returned")] = None
 
 
 class ChatResponse(BaseModel):
     """Response schema for chat endpoint."""
 
-    message: str = Field(description="AI-generated response to the user")
-    metadata: Optional[ChatMetadata] = Field(default=None, description="Optional action metadata")
-
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,  # Built once per chat call and never mutated
+        extra='ignore',
+        defer_build=True,
+        json_schema_extra={
             "example": {
                 "message": "I've created a new task: 'Buy groceries' with medium priority.",
                 "metadata": {
@@ -148,3 +180,7 @@ class ChatResponse(BaseModel):
                 }
             }
         }
+    )
+
+    message: Annotated[str, Field(description="AI-generated response to the user")]
+    metadata: Annotated[Optional[ChatMetadata], Field(description="Optional action metadata")] = None
@@ -2,9 +2,14 @@
 
 import os
 import pytest
+from contextlib import contextmanager
+from datetime import datetime, timedelta
 from typing import Generator
+from sqlalchemy import event, insert
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.ext.compiler import compiles
 from fastapi.testclient import TestClient
-from sqlmodel import Session, create_engine, SQLModel
+from sqlmodel import Session, create_engine, select, SQLModel
 from sqlmodel.pool import StaticPool
 
 from app.main import app
@@ -13,38 +18,122 @@ from app.models import User, Task, ConversationHistory
 from app.auth import hash_password, create_jwt
 
 
+# The test database is SQLite: store PostgreSQL-only column types as JSON
+@compiles(JSONB, "sqlite")
+@compiles(ARRAY, "sqlite")
+def _compile_json_on_sqlite(type_, compiler, **kw):
+    return "JSON"
+
+
+def pytest_configure(config):
+    """Set up environment variables once for the whole test run.
+
+    Values already set by the developer or CI are kept. Tests that need a
+    different value should use monkeypatch.setenv locally.
+    """
+    for key, value in {
+        "OPENAI_API_KEY": "test-api-key",
+        "OPENAI_MODEL": "gpt-4o",
+        "OPENAI_MAX_TOKENS": "500",
+        "OPENAI_TEMPERATURE": "0.7",
+        "CONVERSATION_HISTORY_LIMIT": "10",
+    }.items():
+        os.environ.setdefault(key, value)
+
+
 # Use in-memory SQLite for testing
-@pytest.fixture(name="session")
-def session_fixture() -> Generator[Session, None, None]:
-    """Create a test database session."""
+@pytest.fixture(name="engine", scope="session")
+def engine_fixture():
+    """Create the test database and schema once per test run."""
     engine = create_engine(
         "sqlite:///:memory:",
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
+
+    # pysqlite manages transactions itself and breaks SAVEPOINT; let
+    # SQLAlchemy emit BEGIN instead (see SQLAlchemy's SQLite dialect docs)
+    @event.listens_for(engine, "connect")
+    def do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        # SQLite skips foreign key checks unless asked, PostgreSQL always runs them
+        dbapi_connection.execute("PRAGMA foreign_keys = ON")
+
+    @event.listens_for(engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     SQLModel.metadata.create_all(engine)
-    with Session(engine) as session:
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(name="session")
+def session_fixture(engine) -> Generator[Session, None, None]:
+    """Create a test database session, rolled back after each test.
+
+    The session runs inside an outer transaction; commits made by fixtures
+    and route handlers only release SAVEPOINTs within it.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    # expire_on_commit=False matches app.database.get_session
+    with Session(
+        bind=connection,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint"
+    ) as session:
         yield session
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(name="app_client", scope="session")
+def app_client_fixture() -> TestClient:
+    """Create the test client once; per-test state lives in dependency overrides."""
+    return TestClient(app)
 
 
 @pytest.fixture(name="client")
-def client_fixture(session: Session) -> Generator[TestClient, None, None]:
-    """Create a test client with database override."""
-    def get_session_override():
-        return session
+def client_fixture(app_client: TestClient, session: Session) -> Generator[TestClient, None, None]:
+    """Return the shared test client with this test's database session."""
+    app.dependency_overrides[get_session] = lambda: session
+    yield app_client
+    app.dependency_overrides.pop(get_session, None)
+    app_client.cookies.clear()  # Don't leak auth cookies into the next test
+
+
+@pytest.fixture(name="count_queries")
+def count_queries_fixture(engine):
+    """Return a context manager that records SQL statements sent to the test DB."""
+    @contextmanager
+    def count_queries():
+        queries: list[str] = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            queries.append(statement)
 
-    app.dependency_overrides[get_session] = get_session_override
-    client = TestClient(app)
-    yield client
-    app.dependency_overrides.clear()
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield queries
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    return count_queries
+
+
+@pytest.fixture(name="test_password_hash", scope="session")
+def test_password_hash_fixture() -> str:
+    """Hash the test user's password once; bcrypt is the slowest step per test."""
+    return hash_password("testpassword123")
 
 
 @pytest.fixture(name="test_user")
-def test_user_fixture(session: Session) -> User:
+def test_user_fixture(session: Session, test_password_hash: str) -> User:
     """Create a test user."""
     user = User(
         email="test@example.com",
-        hashed_password=hash_password("testpassword123"),
+        hashed_password=test_password_hash,
         name="Test User"
     )
     session.add(user)
@@ -84,29 +173,26 @@ def test_task_fixture(session: Session, test_user: User) -> Task:
 @pytest.fixture(name="conversation_history")
 def conversation_history_fixture(session: Session, test_user: User) -> list[ConversationHistory]:
     """Create test conversation history."""
-    messages = [
-        ConversationHistory(
-            user_id=test_user.id,
-            role="user",
-            content="Hello"
-        ),
-        ConversationHistory(
-            user_id=test_user.id,
-            role="assistant",
-            content="Hello! How can I help you with your tasks today?"
-        ),
-    ]
-    for msg in messages:
-        session.add(msg)
+    # Explicit, increasing timestamps so history ordered by created_at always
+    # puts the user message first (per-row defaults could tie)
+    now = datetime.utcnow()
+    session.execute(insert(ConversationHistory), [
+        {
+            "user_id": test_user.id,
+            "role": "user",
+            "content": "Hello",
+            "created_at": now
+        },
+        {
+            "user_id": test_user.id,
+            "role": "assistant",
+            "content": "Hello! How can I help you with your tasks today?",
+            "created_at": now + timedelta(seconds=1)
+        },
+    ])
     session.commit()
-    return messages
-
-
-@pytest.fixture(autouse=True)
-def env_setup(monkeypatch):
-    """Set up environment variables for testing."""
-    monkeypatch.setenv("OPENAI_API_KEY", "test-api-key")
-    monkeypatch.setenv("OPENAI_MODEL", "gpt-4o")
-    monkeypatch.setenv("OPENAI_MAX_TOKENS", "500")
-    monkeypatch.setenv("OPENAI_TEMPERATURE", "0.7")
-    monkeypatch.setenv("CONVERSATION_HISTORY_LIMIT", "10")
+    return list(session.exec(
+        select(ConversationHistory)
+        .where(ConversationHistory.user_id == test_user.id)
+        .order_by(ConversationHistory.id)
+    ))
@@ -1,27 +1,46 @@
 """Tests for chat endpoint."""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 from fastapi.testclient import TestClient
 from sqlmodel import Session, select
-from openai import RateLimitError, APIConnectionError, APIError
 
 from app.models import User, ConversationHistory
+from app.routers import chat as chat_module
 from app.schemas import ChatRequest, ChatResponse
 
+# Constant request body, serialized once instead of on every post
+HELLO_BODY = b'{"message":"Hello"}'
+JSON_CONTENT_TYPE = {"content-type": "application/json"}
+
+
+class StubAgent:
+    """Cheap stand-in for TodoAgent that records process_message calls."""
+
+    def __init__(self, payload=None, exc=None):
+        self.payload = payload
+        self.exc = exc
+        self.calls = []
+
+    async def process_message(self, **kwargs):
+        self.calls.append(kwargs)
+        if self.exc:
+            raise self.exc
+        return self.payload
+
 
 class TestChatEndpoint:
     """Test suite for POST /api/chat endpoint."""
 
     def test_chat_endpoint_exists(self, client: TestClient):
         """Test that the chat endpoint exists and requires authentication."""
-        response = client.post("/api/chat", json={"message": "Hello"})
+        response = client.post("/api/chat", content=HELLO_BODY, headers=JSON_CONTENT_TYPE)
         # Should return 401 without auth, not 404
         assert response.status_code in [401, 422]
 
     def test_chat_requires_authentication(self, client: TestClient):
         """Test that chat endpoint requires JWT authentication."""
-        response = client.post("/api/chat", json={"message": "Hello"})
+        response = client.post("/api/chat", content=HELLO_BODY, headers=JSON_CONTENT_TYPE)
         assert response.status_code == 401
         assert "authenticated" in response.json()["detail"].lower()
 
@@ -45,7 +64,7 @@ class TestChatEndpoint:
         response = client.post("/api/chat", json={"message": "   "}, headers=auth_headers)
         assert response.status_code == 422
 
-    @patch('app.routers.chat.TodoAgent')
+    @patch.object(chat_module, 'TodoAgent')
     def test_chat_successful_response(
         self,
         mock_agent_class: MagicMock,
@@ -56,17 +75,16 @@ class TestChatEndpoint:
     ):
         """Test successful chat response with no tool call."""
         # Mock agent response
-        mock_agent = MagicMock()
-        mock_agent.process_message = AsyncMock(return_value={
+        agent = StubAgent(payload={
             "message": "Hello! How can I help you?",
             "metadata": None
         })
-        mock_agent_class.return_value = mock_agent
+        mock_agent_class.return_value = agent
 
         response = client.post(
             "/api/chat",
-            json={"message": "Hello"},
-            headers=auth_headers
+            content=HELLO_BODY,
+            headers={**auth_headers, **JSON_CONTENT_TYPE}
         )
 
         assert response.status_code == 200
@@ -76,12 +94,12 @@ class TestChatEndpoint:
         assert data.get("metadata") is None
 
         # Verify agent was called with correct parameters
-        mock_agent.process_message.assert_called_once()
-        call_args = mock_agent.process_message.call_args
-        assert call_args.kwargs["user_id"] == test_user.id
-        assert call_args.kwargs["user_message"] == "Hello"
+        assert len(agent.calls) == 1
+        call_kwargs = agent.calls[-1]
+        assert call_kwargs["user_id"] == test_user.id
+        assert call_kwargs["user_message"] == "Hello"
 
-    @patch('app.routers.chat.TodoAgent')
+    @patch.object(chat_module, 'TodoAgent')
     def test_chat_with_task_creation_metadata(
         self,
         mock_agent_class: MagicMock,
@@ -91,15 +109,14 @@ class TestChatEndpoint:
     ):
         """Test chat response with task creation metadata."""
         # Mock agent response with metadata
-        mock_agent = MagicMock()
-        mock_agent.process_message = AsyncMock(return_value={
+        agent = StubAgent(payload={
             "message": "I've created a new task: 'Buy milk' with high priority.",
             "metadata": {
                 "action": "task_created",
                 "task_id": 42
             }
         })
-        mock_agent_class.return_value = mock_agent
+        mock_agent_class.return_value = agent
 
         response = client.post(
             "/api/chat",
@@ -114,7 +131,7 @@ class TestChatEndpoint:
         assert data["metadata"]["action"] == "task_created"
         assert data["metadata"]["task_id"] == 42
 
-    @patch('app.routers.chat.TodoAgent')
+    @patch.object(chat_module, 'TodoAgent')
     def test_chat_with_task_listing_metadata(
         self,
         mock_agent_class: MagicMock,
@@ -122,15 +139,14 @@ class TestChatEndpoint:
         auth_headers: dict
     ):
         """Test chat response with task listing metadata."""
-        mock_agent = MagicMock()
-        mock_agent.process_message = AsyncMock(return_value={
+        agent = StubAgent(payload={
             "message": "You have 5 tasks.",
             "metadata": {
                 "action": "tasks_listed",
                 "count": 5
             }
         })
-        mock_agent_class.return_value = mock_agent
+        mock_agent_class.return_value = agent
 
         response = client.post(
             "/api/chat",
@@ -153,7 +169,7 @@ class TestChatEndpoint:
         assert "Only report \"not found\" AFTER calling list_tasks()" in SYSTEM_PROMPT
         assert "Prefer updating existing tasks" in SYSTEM_PROMPT
 
-    @patch('app.routers.chat.TodoAgent')
+    @patch.object(chat_module, 'TodoAgent')
     def test_chat_handles_openai_rate_limit(
         self,
         mock_agent_class: MagicMock,
@@ -161,22 +177,21 @@ class TestChatEndpoint:
         auth_headers: dict
     ):
         """Test that OpenAI rate limit errors return 429."""
-        mock_agent = MagicMock()
-        mock_agent.process_message = AsyncMock(
-            side_effect=RateLimitError("Rate limit exceeded", response=None, body=None)
-        )
-        mock_agent_class.return_value = mock_agent
+        from openai import RateLimitError
+
+        agent = StubAgent(exc=RateLimitError("Rate limit exceeded", response=None, body=None))
+        mock_agent_class.return_value = agent
 
         response = client.post(
             "/api/chat",
-            json={"message": "Hello"},
-            headers=auth_headers
+            content=HELLO_BODY,
+            headers={**auth_headers, **JSON_CONTENT_TYPE}
         )
 
         assert response.status_code == 429
         assert "rate limit" in response.json()["detail"].lower()
 
-    @patch('app.routers.chat.TodoAgent')
+    @patch.object(chat_module, 'TodoAgent')
     def test_chat_handles_openai_connection_error(
         self,
         mock_agent_class: MagicMock,
@@ -184,22 +199,21 @@ class TestChatEndpoint:
         auth_headers: dict
     ):
         """Test that OpenAI connection errors return 503."""
-        mock_agent = MagicMock()
-        mock_agent.process_message = AsyncMock(
-            side_effect=APIConnectionError(request=None)
-        )
-        mock_agent_class.return_value = mock_agent
+        from openai import APIConnectionError
+
+        agent = StubAgent(exc=APIConnectionError(request=None))
+        mock_agent_class.return_value = agent
 
         response = client.post(
             "/api/chat",
-            json={"message": "Hello"},
-            headers=auth_headers
+            content=HELLO_BODY,
+            headers={**auth_headers, **JSON_CONTENT_TYPE}
         )
 
         assert response.status_code == 503
         assert "connect" in response.json()["detail"].lower()
 
-    @patch('app.routers.chat.TodoAgent')
+    @patch.object(chat_module, 'TodoAgent')
     def test_chat_handles_openai_api_error(
         self,
         mock_agent_class: MagicMock,
@@ -207,22 +221,21 @@ class TestChatEndpoint:
         auth_headers: dict
     ):
         """Test that OpenAI API errors return 500."""
-        mock_agent = MagicMock()
-        mock_agent.process_message = AsyncMock(
-            side_effect=APIError("API Error", request=None, body=None)
-        )
-        mock_agent_class.return_value = mock_agent
+        from openai import APIError
+
+        agent = StubAgent(exc=APIError("API Error", request=None, body=None))
+        mock_agent_class.return_value = agent
 
         response = client.post(
             "/api/chat",
-            json={"message": "Hello"},
-            headers=auth_headers
+            content=HELLO_BODY,
+            headers={**auth_headers, **JSON_CONTENT_TYPE}
         )
 
         assert response.status_code == 500
         assert "api error" in response.json()["detail"].lower()
 
-    @patch('app.routers.chat.TodoAgent')
+    @patch.object(chat_module, 'TodoAgent')
     def test_chat_handles_generic_exception(
         self,
         mock_agent_class: MagicMock,
@@ -230,22 +243,19 @@ class TestChatEndpoint:
         auth_headers: dict
     ):
         """Test that generic exceptions return 500."""
-        mock_agent = MagicMock()
-        mock_agent.process_message = AsyncMock(
-            side_effect=Exception("Unexpected error")
-        )
-        mock_agent_class.return_value = mock_agent
+        agent = StubAgent(exc=Exception("Unexpected error"))
+        mock_agent_class.return_value = agent
 
         response = client.post(
             "/api/chat",
-            json={"message": "Hello"},
-            headers=auth_headers
+            content=HELLO_BODY,
+            headers={**auth_headers, **JSON_CONTENT_TYPE}
         )
 
         assert response.status_code == 500
         assert "internal server error" in response.json()["detail"].lower()
 
-    @patch('app.routers.chat.TodoAgent')
+    @patch.object(chat_module, 'TodoAgent')
     def test_chat_stores_conversation_in_db(
         self,
         mock_agent_class: MagicMock,
@@ -255,12 +265,11 @@ class TestChatEndpoint:
         auth_headers: dict
     ):
         """Test that conversation messages are stored (verified via agent call)."""
-        mock_agent = MagicMock()
-        mock_agent.process_message = AsyncMock(return_value={
+        agent = StubAgent(payload={
             "message": "Response",
             "metadata": None
         })
-        mock_agent_class.return_value = mock_agent
+        mock_agent_class.return_value = agent
 
         client.post(
             "/api/chat",
@@ -269,9 +278,9 @@ class TestChatEndpoint:
         )
 
         # Verify agent was called with database session
-        call_args = mock_agent.process_message.call_args
-        assert "session" in call_args.kwargs
-        assert call_args.kwargs["user_message"] == "Test message"
+        call_kwargs = agent.calls[-1]
+        assert "session" in call_kwargs
+        assert call_kwargs["user_message"] == "Test message"
 
     def test_chat_enforces_user_isolation(
         self,
@@ -301,13 +310,12 @@ class TestChatEndpoint:
 
         # Test user makes a request - should only see their own history
         # (This is verified internally by the agent loading only test_user's history)
-        with patch('app.routers.chat.TodoAgent') as mock_agent_class:
-            mock_agent = MagicMock()
-            mock_agent.process_message = AsyncMock(return_value={
+        with patch.object(chat_module, 'TodoAgent') as mock_agent_class:
+            agent = StubAgent(payload={
                 "message": "Response",
                 "metadata": None
             })
-            mock_agent_class.return_value = mock_agent
+            mock_agent_class.return_value = agent
 
             client.post(
                 "/api/chat",
@@ -316,11 +324,11 @@ class TestChatEndpoint:
             )
 
             # Verify agent was called with test_user's ID, not other_user's ID
-            call_args = mock_agent.process_message.call_args
-            assert call_args.kwargs["user_id"] == test_user.id
-            assert call_args.kwargs["user_id"] != other_user.id
+            call_kwargs = agent.calls[-1]
+            assert call_kwargs["user_id"] == test_user.id
+            assert call_kwargs["user_id"] != other_user.id
 
-    @patch('app.routers.chat.TodoAgent')
+    @patch.object(chat_module, 'TodoAgent')
     def test_chat_response_schema_validation(
         self,
         mock_agent_class: MagicMock,
@@ -328,15 +336,14 @@ class TestChatEndpoint:
         auth_headers: dict
     ):
         """Test that response conforms to ChatResponse schema."""
-        mock_agent = MagicMock()
-        mock_agent.process_message = AsyncMock(return_value={
+        agent = StubAgent(payload={
             "message": "Test response",
             "metadata": {
                 "action": "task_created",
                 "task_id": 1
             }
         })
-        mock_agent_class.return_value = mock_agent
+        mock_agent_class.return_value = agent
 
         response = client.post(
             "/api/chat",
@@ -364,12 +371,12 @@ class TestChatEndpoint:
         invalid_headers = {"Cookie": "access_token=invalid.token.here"}
         response = client.post(
             "/api/chat",
-            json={"message": "Hello"},
-            headers=invalid_headers
+            content=HELLO_BODY,
+            headers={**invalid_headers, **JSON_CONTENT_TYPE}
         )
         assert response.status_code == 401
 
-    @patch('app.routers.chat.TodoAgent')
+    @patch.object(chat_module, 'TodoAgent')
     def test_chat_message_trimming(
         self,
         mock_agent_class: MagicMock,
@@ -377,12 +384,11 @@ class TestChatEndpoint:
         auth_headers: dict
     ):
         """Test that whitespace is trimmed from messages."""
-        mock_agent = MagicMock()
-        mock_agent.process_message = AsyncMock(return_value={
+        agent = StubAgent(payload={
             "message": "Response",
             "metadata": None
         })
-        mock_agent_class.return_value = mock_agent
+        mock_agent_class.return_value = agent
 
         response = client.post(
             "/api/chat",
@@ -392,5 +398,5 @@ class TestChatEndpoint:
 
         assert response.status_code == 200
         # Verify trimmed message was passed to agent
-        call_args = mock_agent.process_message.call_args
-        assert call_args.kwargs["user_message"] == "Hello"
+        call_kwargs = agent.calls[-1]
+        assert call_kwargs["user_message"] == "Hello"
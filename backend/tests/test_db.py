@@ -0,0 +1,128 @@
+"""Tests for the worker database helpers in app.db."""
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from psycopg2.extras import Json
+from sqlalchemy.dialects import postgresql
+from sqlmodel import Session
+
+from app.db import bulk
+from app.db.notifications import claim_pending_notifications
+from app.models import (
+    Notification,
+    NotificationChannelEnum,
+    NotificationStatusEnum,
+    RecurrencePattern,
+    Reminder,
+)
+
+
+@pytest.fixture(name="pg_engine")
+def pg_engine_fixture() -> MagicMock:
+    """Engine stand-in with the PostgreSQL dialect's identifier quoting."""
+    engine = MagicMock()
+    engine.dialect = postgresql.dialect()
+    return engine
+
+
+class TestBulkInsert:
+    """Test suite for app.db.bulk.bulk_insert (execute_values patched)."""
+
+    def test_rows_are_grouped_by_key_set(self, pg_engine: MagicMock):
+        """Test that rows with different columns go out as separate statements."""
+        table = Notification.__table__
+        rows = [
+            {"id": uuid4(), "reminder_id": uuid4(), "user_id": uuid4(), "channel": NotificationChannelEnum.email},
+            {"id": uuid4(), "reminder_id": uuid4(), "user_id": uuid4(), "channel": NotificationChannelEnum.push,
+             "status": NotificationStatusEnum.sent},
+            {"user_id": uuid4(), "id": uuid4(), "channel": NotificationChannelEnum.sms, "reminder_id": uuid4()},
+        ]
+
+        with patch.object(bulk, "execute_values") as execute_values:
+            bulk.bulk_insert(pg_engine, table, rows, page_size=10)
+
+        assert execute_values.call_count == 2
+        (_, first_sql, first_values), first_kwargs = execute_values.call_args_list[0]
+        (_, second_sql, second_values), _ = execute_values.call_args_list[1]
+        assert first_sql == (
+            'INSERT INTO notifications (channel, id, reminder_id, user_id) '
+            'VALUES %s ON CONFLICT DO NOTHING'
+        )
+        assert first_kwargs == {"page_size": 10}
+        # Key order within a row does not matter; enums are sent as their values
+        assert [values[0] for values in first_values] == ["email", "sms"]
+        assert '"status"' not in first_sql and "status" in second_sql
+        assert len(second_values) == 1
+
+    def test_unknown_column_raises_before_any_insert(self, pg_engine: MagicMock):
+        """Test that a misspelled column is reported instead of sent to the database."""
+        with patch.object(bulk, "execute_values") as execute_values:
+            with pytest.raises(ValueError, match="notifications has no column\\(s\\): chanel"):
+                bulk.bulk_insert(pg_engine, Notification.__table__, [{"id": uuid4(), "chanel": "email"}])
+
+        execute_values.assert_not_called()
+        pg_engine.begin.assert_not_called()
+
+    def test_empty_rows_do_not_open_a_transaction(self, pg_engine: MagicMock):
+        """Test that an empty batch is a no-op."""
+        bulk.bulk_insert(pg_engine, Notification.__table__, [])
+        pg_engine.begin.assert_not_called()
+
+
+class TestAdapt:
+    """Test suite for app.db.bulk._adapt."""
+
+    def test_json_column_values_are_wrapped(self):
+        """Test that JSONB values get a Json wrapper serialized with orjson."""
+        column_type = Reminder.__table__.c.notification_channels.type
+        adapted = bulk._adapt(column_type, {"channels": ["email"]})
+
+        assert isinstance(adapted, Json)
+        assert adapted.dumps(adapted.adapted) == '{"channels":["email"]}'
+
+    def test_enum_values_are_unwrapped(self):
+        """Test that Enum members are sent as their values."""
+        column_type = Notification.__table__.c.status.type
+        assert bulk._adapt(column_type, NotificationStatusEnum.pending) == "pending"
+
+    def test_array_values_pass_through(self):
+        """Test that lists for ARRAY columns are left for psycopg2's array adaptation."""
+        column_type = RecurrencePattern.__table__.c.days_of_week.type
+        assert bulk._adapt(column_type, [0, 2, 4]) == [0, 2, 4]
+
+    def test_none_passes_through(self):
+        """Test that NULLs are not wrapped, even for JSON columns."""
+        column_type = Reminder.__table__.c.notification_channels.type
+        assert bulk._adapt(column_type, None) is None
+
+
+class TestClaimPendingNotifications:
+    """Test suite for app.db.notifications.claim_pending_notifications."""
+
+    def test_claims_oldest_pending_up_to_limit(self, session: Session):
+        """Test that only pending rows are claimed, oldest first."""
+        base = datetime(2026, 1, 1, 9, 0)
+        notifications = [
+            Notification(
+                reminder_id=uuid4(),
+                user_id=uuid4(),
+                channel=NotificationChannelEnum.email,
+                status=status,
+                created_at=base + timedelta(minutes=minutes)
+            )
+            for status, minutes in [
+                (NotificationStatusEnum.pending, 2),
+                (NotificationStatusEnum.sent, 0),
+                (NotificationStatusEnum.pending, 1),
+                (NotificationStatusEnum.pending, 3),
+            ]
+        ]
+        session.add_all(notifications)
+        session.commit()
+
+        claimed = claim_pending_notifications(session, limit=2)
+
+        assert claimed == [notifications[2].id, notifications[0].id]
@@ -0,0 +1,100 @@
+"""Tests for the transactional outbox relay."""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from app.events import outbox
+from app.models import EventOutbox, User
+
+
+class FakePublisher:
+    """Publisher that records task ids and fails for the given ones."""
+
+    def __init__(self, failing_task_ids: frozenset[int] = frozenset()):
+        self.failing_task_ids = failing_task_ids
+        self.published = []
+
+    async def _publish(self, event):
+        task_id = event.model_dump(mode="json")["data"]["task_id"]
+        if task_id in self.failing_task_ids:
+            raise ConnectionError("broker unavailable")
+        self.published.append(task_id)
+
+    publish_task_event = _publish
+    publish_reminder_event = _publish
+
+
+@pytest.fixture(name="relay_session")
+def relay_session_fixture(session: Session, monkeypatch) -> Session:
+    """Make the relay open the test session instead of a pooled one."""
+    monkeypatch.setattr(outbox, "Session", lambda engine: session)
+    return session
+
+
+def _create_tasks(client: TestClient, auth_headers: dict, count: int) -> list[int]:
+    """Create tasks through the API, queueing one task.created event each."""
+    ids = []
+    for i in range(count):
+        response = client.post("/api/tasks/", json={"title": f"Task {i}"}, headers=auth_headers)
+        assert response.status_code == 201
+        ids.append(response.json()["id"])
+    return ids
+
+
+def _outbox_rows(session: Session) -> list[EventOutbox]:
+    """Return the outbox rows still in the table, oldest first."""
+    return list(session.exec(select(EventOutbox).order_by(EventOutbox.id)).all())
+
+
+class TestOutboxRelay:
+    """Test suite for retries and dead-lettering in the outbox relay."""
+
+    async def test_failing_row_does_not_block_later_rows(
+        self,
+        client: TestClient,
+        relay_session: Session,
+        test_user: User,
+        auth_headers: dict
+    ):
+        """Test that a failed publish is skipped and counted, not retried in place."""
+        first, second = _create_tasks(client, auth_headers, 2)
+        publisher = FakePublisher(failing_task_ids={first})
+
+        await outbox._relay_batch(publisher)
+
+        assert publisher.published == [second]
+        rows = _outbox_rows(relay_session)
+        assert [(row.payload["data"]["task_id"], row.attempts) for row in rows] == [(first, 1)]
+
+    async def test_row_is_dead_lettered_after_max_attempts(
+        self,
+        client: TestClient,
+        relay_session: Session,
+        test_user: User,
+        auth_headers: dict
+    ):
+        """Test that a row reaching OUTBOX_MAX_ATTEMPTS is kept but no longer claimed."""
+        (task_id,) = _create_tasks(client, auth_headers, 1)
+        row = _outbox_rows(relay_session)[0]
+        row.attempts = outbox.OUTBOX_MAX_ATTEMPTS - 1
+        relay_session.commit()
+
+        await outbox._relay_batch(FakePublisher(failing_task_ids={task_id}))
+
+        assert _outbox_rows(relay_session)[0].attempts == outbox.OUTBOX_MAX_ATTEMPTS
+        assert outbox._claim_batch(relay_session) == []
+
+    async def test_unknown_event_type_is_dead_lettered_immediately(
+        self,
+        relay_session: Session
+    ):
+        """Test that a row that cannot be rebuilt is dead-lettered without retries."""
+        relay_session.add(EventOutbox(topic=outbox.TASK_EVENTS_TOPIC, event_type="NoSuchEvent", payload={}))
+        relay_session.commit()
+        publisher = FakePublisher()
+
+        await outbox._relay_batch(publisher)
+
+        assert publisher.published == []
+        assert _outbox_rows(relay_session)[0].attempts == outbox.OUTBOX_MAX_ATTEMPTS
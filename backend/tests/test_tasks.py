@@ -0,0 +1,307 @@
+"""Tests for tasks endpoints."""
+
+import pytest
+from datetime import datetime, timedelta
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from app.auth import create_jwt
+from app.models import EventOutbox, Task, User
+
+
+class TestGetTasks:
+    """Test suite for GET /api/tasks/ endpoint."""
+
+    def test_get_tasks_has_no_n_plus_one(
+        self,
+        client: TestClient,
+        test_task: Task,
+        auth_headers: dict,
+        count_queries
+    ):
+        """Test that listing tasks does not lazy-load related rows per task."""
+        with count_queries() as queries:
+            response = client.get("/api/tasks/", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert [task["id"] for task in response.json()] == [test_task.id]
+        assert len(queries) <= 2
+
+    def test_get_tasks_paginates_with_cursor(
+        self,
+        client: TestClient,
+        session: Session,
+        test_user: User,
+        auth_headers: dict
+    ):
+        """Test that tasks are returned newest first across cursor pages."""
+        tasks = [Task(user_id=test_user.id, title=f"Task {i}") for i in range(3)]
+        session.add_all(tasks)
+        session.commit()
+        expected = sorted(tasks, key=lambda t: (t.created_at, t.id), reverse=True)
+
+        first = client.get("/api/tasks/?limit=2", headers=auth_headers)
+        assert first.status_code == 200
+        assert [t["id"] for t in first.json()] == [t.id for t in expected[:2]]
+        cursor = first.headers["X-Next-Cursor"]
+
+        second = client.get(
+            "/api/tasks/", params={"limit": 2, "cursor": cursor}, headers=auth_headers
+        )
+        assert second.status_code == 200
+        assert [t["id"] for t in second.json()] == [expected[2].id]
+        assert "X-Next-Cursor" not in second.headers
+
+    def test_get_tasks_accepts_offset_aware_cursor(
+        self,
+        client: TestClient,
+        session: Session,
+        test_user: User,
+        auth_headers: dict
+    ):
+        """Test that a cursor with a UTC offset ('+' must be URL-encoded) is normalized to UTC."""
+        base = datetime(2026, 1, 1, 12, 0)
+        tasks = [
+            Task(user_id=test_user.id, title=f"Task {i}", created_at=base + timedelta(minutes=i))
+            for i in range(3)
+        ]
+        session.add_all(tasks)
+        session.commit()
+
+        # Same instant as tasks[2].created_at, written at +05:00
+        local_time = tasks[2].created_at + timedelta(hours=5)
+        cursor = f"{local_time.isoformat()}+05:00,{tasks[2].id}"
+
+        response = client.get("/api/tasks/", params={"cursor": cursor}, headers=auth_headers)
+
+        assert response.status_code == 200
+        assert [t["id"] for t in response.json()] == [tasks[1].id, tasks[0].id]
+
+    def test_get_tasks_rejects_invalid_cursor(self, client: TestClient, auth_headers: dict):
+        """Test that a malformed cursor returns 400."""
+        response = client.get("/api/tasks/?cursor=not-a-cursor", headers=auth_headers)
+        assert response.status_code == 400
+
+
+def _outbox_events(session: Session) -> list[tuple[str, str, dict]]:
+    """Return queued outbox rows as (topic, event type, CloudEvent data)."""
+    rows = session.exec(select(EventOutbox).order_by(EventOutbox.id)).all()
+    return [(row.topic, row.event_type, row.payload["data"]) for row in rows]
+
+
+class TestTaskMutations:
+    """Test suite for the task write endpoints and their outbox events."""
+
+    def test_create_task_returns_row_and_queues_events(
+        self,
+        client: TestClient,
+        session: Session,
+        test_user: User,
+        auth_headers: dict
+    ):
+        """Test that INSERT ... RETURNING yields the new row and both events."""
+        response = client.post(
+            "/api/tasks/",
+            json={"title": "Buy milk", "priority": "high", "reminder_time": "2026-02-01T09:00:00"},
+            headers=auth_headers
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["title"] == "Buy milk"
+        assert data["priority"] == "high"
+        assert data["user_id"] == test_user.id
+        assert session.get(Task, data["id"]) is not None
+
+        events = _outbox_events(session)
+        assert [(topic, event_type) for topic, event_type, _ in events] == [
+            ("task-events", "TaskCreatedEvent"),
+            ("reminders", "TaskReminderScheduledEvent"),
+        ]
+        assert events[0][2]["task_id"] == data["id"]
+        assert events[0][2]["title"] == "Buy milk"
+
+    def test_create_task_for_deleted_user_returns_401(
+        self,
+        client: TestClient,
+        session: Session
+    ):
+        """Test that a still-valid token for a deleted user gets 401, not a 500."""
+        token = create_jwt(999999, "deleted@example.com")
+
+        response = client.post(
+            "/api/tasks/",
+            json={"title": "Orphan"},
+            headers={"Cookie": f"access_token={token}"}
+        )
+
+        assert response.status_code == 401
+        assert response.json()["detail"] == "User not found"
+        assert _outbox_events(session) == []
+
+    def test_update_task_diffs_previous_values(
+        self,
+        client: TestClient,
+        session: Session,
+        test_task: Task,
+        auth_headers: dict
+    ):
+        """Test that the update returns the new row and diffs only changed fields."""
+        response = client.put(
+            f"/api/tasks/{test_task.id}",
+            json={"title": "Renamed", "priority": "medium"},
+            headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        assert response.json()["title"] == "Renamed"
+        assert response.json()["priority"] == "medium"
+
+        events = _outbox_events(session)
+        assert len(events) == 1
+        topic, event_type, payload = events[0]
+        assert (topic, event_type) == ("task-events", "TaskUpdatedEvent")
+        assert payload["changes"] == {"title": "Renamed"}
+        assert payload["previous_values"] == {"title": "Test Task"}
+
+    def test_update_task_without_changes_queues_nothing(
+        self,
+        client: TestClient,
+        session: Session,
+        test_task: Task,
+        auth_headers: dict
+    ):
+        """Test that resubmitting current values emits no task.updated event."""
+        response = client.put(
+            f"/api/tasks/{test_task.id}",
+            json={"title": "Test Task"},
+            headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        assert _outbox_events(session) == []
+
+    def test_update_task_clearing_reminder_queues_cancellation(
+        self,
+        client: TestClient,
+        session: Session,
+        test_user: User,
+        auth_headers: dict
+    ):
+        """Test that removing reminder_time queues reminder.cancelled."""
+        task = Task(user_id=test_user.id, title="Call mom", reminder_time=datetime(2026, 2, 1, 9))
+        session.add(task)
+        session.commit()
+
+        response = client.put(
+            f"/api/tasks/{task.id}", json={"reminder_time": None}, headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        assert response.json()["reminder_time"] is None
+        events = _outbox_events(session)
+        assert [event_type for _, event_type, _ in events] == [
+            "TaskUpdatedEvent",
+            "ReminderCancelledEvent",
+        ]
+        assert events[1][2]["reason"] == "reminder_removed"
+
+    def test_toggle_task_flips_completion(
+        self,
+        client: TestClient,
+        session: Session,
+        test_task: Task,
+        auth_headers: dict
+    ):
+        """Test that the not_() toggle flips is_complete in both directions."""
+        first = client.patch(f"/api/tasks/{test_task.id}/toggle", headers=auth_headers)
+        second = client.patch(f"/api/tasks/{test_task.id}/toggle", headers=auth_headers)
+
+        assert first.status_code == 200
+        assert first.json()["is_complete"] is True
+        assert second.json()["is_complete"] is False
+
+        events = _outbox_events(session)
+        assert [payload["changes"] for _, _, payload in events] == [
+            {"is_complete": True},
+            {"is_complete": False},
+        ]
+        assert [payload["previous_values"] for _, _, payload in events] == [
+            {"is_complete": False},
+            {"is_complete": True},
+        ]
+
+    def test_delete_task_queues_events(
+        self,
+        client: TestClient,
+        session: Session,
+        test_user: User,
+        auth_headers: dict
+    ):
+        """Test that DELETE ... RETURNING feeds task.deleted and reminder.cancelled."""
+        task = Task(user_id=test_user.id, title="Old task", reminder_time=datetime(2026, 2, 1, 9))
+        session.add(task)
+        session.commit()
+        task_id = task.id
+
+        response = client.delete(f"/api/tasks/{task_id}", headers=auth_headers)
+
+        assert response.status_code == 204
+        session.expire_all()
+        assert session.get(Task, task_id) is None
+
+        events = _outbox_events(session)
+        assert [(topic, event_type) for topic, event_type, _ in events] == [
+            ("task-events", "TaskDeletedEvent"),
+            ("reminders", "ReminderCancelledEvent"),
+        ]
+        assert events[0][2]["title"] == "Old task"
+        assert events[0][2]["was_complete"] is False
+        assert events[1][2]["reason"] == "task_deleted"
+
+
+class TestTaskOwnership:
+    """Test that another user's task is reported as missing (404, not 403)."""
+
+    @pytest.fixture(name="other_task")
+    def other_task_fixture(self, session: Session, test_password_hash: str) -> Task:
+        """Create a task owned by a second user."""
+        other = User(email="other@example.com", hashed_password=test_password_hash, name="Other")
+        session.add(other)
+        session.commit()
+        task = Task(user_id=other.id, title="Not yours")
+        session.add(task)
+        session.commit()
+        return task
+
+    @pytest.mark.parametrize("method,path,body", [
+        ("PUT", "/api/tasks/{id}", {"title": "Hijacked"}),
+        ("PATCH", "/api/tasks/{id}/toggle", None),
+        ("DELETE", "/api/tasks/{id}", None),
+    ])
+    def test_other_users_task_returns_404(
+        self,
+        client: TestClient,
+        session: Session,
+        other_task: Task,
+        auth_headers: dict,
+        method: str,
+        path: str,
+        body: dict | None
+    ):
+        """Test that mutating another user's task returns 404 and changes nothing."""
+        response = client.request(
+            method, path.format(id=other_task.id), json=body, headers=auth_headers
+        )
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Task not found"
+        session.refresh(other_task)
+        assert other_task.title == "Not yours"
+        assert other_task.is_complete is False
+
+    def test_missing_task_returns_404(self, client: TestClient, auth_headers: dict):
+        """Test that a task id that does not exist returns the same 404."""
+        response = client.delete("/api/tasks/999999", headers=auth_headers)
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Task not found"
@@ -9,6 +9,8 @@ import TaskList from '@/components/TaskList'
 
 export default function DashboardPage() {
   const [tasks, setTasks] = useState<Task[]>([])
+  const [nextCursor, setNextCursor] = useState<string | null>(null)
+  const [loadingMore, setLoadingMore] = useState(false)
   const [loading, setLoading] = useState(true)
   const [error, setError] = useState('')
   const [showForm, setShowForm] = useState(false)
@@ -16,8 +18,9 @@ export default function DashboardPage() {
   const fetchTasks = async () => {
     try {
       setLoading(true)
-      const data = await api.getTasks()
-      setTasks(data as Task[])
+      const page = await api.getTasks()
+      setTasks(page.tasks)
+      setNextCursor(page.nextCursor)
     } catch (err: any) {
       setError(err.message || 'Failed to fetch tasks')
     } finally {
@@ -25,6 +28,20 @@ export default function DashboardPage() {
     }
   }
 
+  const loadMoreTasks = async () => {
+    if (!nextCursor) return
+    try {
+      setLoadingMore(true)
+      const page = await api.getTasks(nextCursor)
+      setTasks([...tasks, ...page.tasks])
+      setNextCursor(page.nextCursor)
+    } catch (err: any) {
+      setError(err.message || 'Failed to fetch tasks')
+    } finally {
+      setLoadingMore(false)
+    }
+  }
+
   useEffect(() => {
     fetchTasks()
   }, [])
@@ -105,7 +122,20 @@ export default function DashboardPage() {
               )}
             </div>
           ) : (
-            <TaskList tasks={tasks} onToggle={handleTaskToggle} onRefresh={fetchTasks} />
+            <>
+              <TaskList tasks={tasks} onToggle={handleTaskToggle} onRefresh={fetchTasks} />
+              {nextCursor && (
+                <div className="mt-6 text-center">
+                  <button
+                    onClick={loadMoreTasks}
+                    disabled={loadingMore}
+                    className="inline-flex items-center px-4 py-2 border border-gray-300 text-sm font-medium rounded-md text-gray-700 bg-white hover:bg-gray-50 disabled:opacity-50 disabled:cursor-not-allowed"
+                  >
+                    {loadingMore ? 'Loading...' : 'Load more'}
+                  </button>
+                </div>
+              )}
+            </>
           )}
         </div>
       </div>
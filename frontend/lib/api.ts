@@ -1,9 +1,11 @@
+import { TaskPage } from '@/lib/types'
+
 const API_BASE_URL = process.env.NEXT_PUBLIC_API_URL || '/api'
 
-async function apiRequest<T>(
+async function apiFetch(
   endpoint: string,
   options: RequestInit = {}
-): Promise<T> {
+): Promise<Response> {
   const response = await fetch(`${API_BASE_URL}${endpoint}`, {
     ...options,
     credentials: 'include',
@@ -25,6 +27,15 @@ async function apiRequest<T>(
     throw new Error(error.detail || 'Request failed')
   }
 
+  return response
+}
+
+async function apiRequest<T>(
+  endpoint: string,
+  options: RequestInit = {}
+): Promise<T> {
+  const response = await apiFetch(endpoint, options)
+
   if (response.status === 204) {
     return {} as T
   }
@@ -47,7 +58,17 @@ export const api = {
 
   logout: () => apiRequest('/auth/logout', { method: 'POST' }),
 
-  getTasks: () => apiRequest('/tasks'),
+  // One page of tasks, newest first. Pass the previous page's nextCursor to
+  // load the next one; the cursor holds an ISO timestamp (may contain '+'),
+  // so it must be URL-encoded.
+  getTasks: async (cursor?: string | null): Promise<TaskPage> => {
+    const query = cursor ? `?cursor=${encodeURIComponent(cursor)}` : ''
+    const response = await apiFetch(`/tasks${query}`)
+    return {
+      tasks: await response.json(),
+      nextCursor: response.headers.get('X-Next-Cursor'),
+    }
+  },
 
   createTask: (task: { title: string; description?: string; priority?: string }) =>
     apiRequest('/tasks', {
@@ -19,6 +19,11 @@ export interface Task {
   updated_at: string
 }
 
+export interface TaskPage {
+  tasks: Task[]
+  nextCursor: string | null
+}
+
 export interface ApiError {
   detail: string
 }